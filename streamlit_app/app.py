@@ -19,9 +19,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-def load_css():
-    st.markdown("""
+# Custom CSS - static blob rendered through st.html so reruns skip the
+# markdown parsing pipeline entirely
+_STYLE = """
     <style>
     /* Main title styling */
     .main-title {
@@ -70,9 +70,13 @@ def load_css():
     #MainMenu {visibility: hidden;}
     footer {visibility: hidden;}
     </style>
-    """, unsafe_allow_html=True)
+    """
 
-load_css()
+@st.cache_data(show_spinner=False)
+def _css_html():
+    return _STYLE
+
+st.html(_css_html())
 
 # Title and introduction
 st.markdown('<h1 class="main-title">🏦 Population Group-wise Deposits Analysis</h1>', unsafe_allow_html=True)
@@ -92,73 +96,56 @@ with col2:
     </div>
     """, unsafe_allow_html=True)
 
-# Quick stats section
-st.markdown("### 📊 Project Overview")
-
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.markdown("""
+# Static card grids - one st.html element each instead of one per card
+_METRIC_CARDS_HTML = """
+<div style="display:grid; grid-template-columns:repeat(4,1fr); gap:1rem;">
     <div class="metric-card">
         <h3 style="margin:0;">6,977</h3>
         <p style="margin:0.5rem 0 0 0;">Records Analyzed</p>
     </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
     <div class="metric-card">
         <h3 style="margin:0;">18</h3>
         <p style="margin:0.5rem 0 0 0;">ML Models Trained</p>
     </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown("""
     <div class="metric-card">
         <h3 style="margin:0;">99.76%</h3>
         <p style="margin:0.5rem 0 0 0;">Best Model R² Score</p>
     </div>
-    """, unsafe_allow_html=True)
-
-with col4:
-    st.markdown("""
     <div class="metric-card">
         <h3 style="margin:0;">₹58.8B</h3>
         <p style="margin:0.5rem 0 0 0;">Total Deposits</p>
     </div>
-    """, unsafe_allow_html=True)
-
-st.markdown("---")
-
-# Navigation guide
-st.markdown("### 🧭 Navigation Guide")
-
-col1, col2, col3 = st.columns(3)
+</div>
+"""
 
-with col1:
-    st.markdown("""
+_NAV_CARDS_HTML = """
+<div style="display:grid; grid-template-columns:repeat(3,1fr); gap:1rem;">
     <div class="info-box">
         <h4>📈 Exploratory Analysis</h4>
         <p>Dive into data distributions, correlations, and statistical insights.</p>
     </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
     <div class="info-box">
         <h4>🤖 Machine Learning</h4>
         <p>Explore model performance, comparisons, and predictions.</p>
     </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown("""
     <div class="info-box">
         <h4>💡 Insights & Recommendations</h4>
         <p>Discover actionable business insights and strategic recommendations.</p>
     </div>
-    """, unsafe_allow_html=True)
+</div>
+"""
+
+# Quick stats section
+st.markdown("### 📊 Project Overview")
+
+st.html(_METRIC_CARDS_HTML)
+
+st.markdown("---")
+
+# Navigation guide
+st.markdown("### 🧭 Navigation Guide")
+
+st.html(_NAV_CARDS_HTML)
 
 st.markdown("---")
 
@@ -217,3 +204,13 @@ st.markdown("""
     <p>Built with ❤️ using Streamlit | Author: Himanshu | Date: November 9, 2025</p>
 </div>
 """, unsafe_allow_html=True)
+
+# Warm the shared caches after the landing page has rendered, so the first
+# navigation to a data page hits hot entries instead of paying the cold load
+from utils.data_loader import (load_best_model, load_cleaned_data,
+                               load_featured_data, load_model_comparison)
+
+load_cleaned_data()
+load_featured_data()
+load_model_comparison()
+load_best_model()
@@ -7,20 +7,40 @@ import pandas as pd
 import sys
 from pathlib import Path
 
-# Add utils to path
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.data_loader import load_cleaned_data, filter_data, get_summary_stats
+# Make utils importable when the page runs standalone (no-op on reruns)
+_APP_DIR = str(Path(__file__).parent.parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+from utils.data_loader import (
+    load_cleaned_data, filter_data, get_summary_stats, get_unique_sorted,
+    compute_eda_aggregates, to_csv_bytes
+)
 from utils.visualizations import (
     create_distribution_plot, create_correlation_heatmap,
     create_population_group_chart, create_regional_analysis,
-    create_box_plot_by_category, create_top_states_chart
+    create_box_plot_by_category, create_top_states_chart, HR
 )
 
 st.set_page_config(page_title="EDA - Deposits Analysis", page_icon="📈", layout="wide")
 
+@st.cache_data(show_spinner=False)
+def _describe(df):
+    """Cached describe() of the numerical columns per filter combination"""
+    return df[['no_of_offices', 'no_of_accounts', 'deposit_amount']].describe()
+
+@st.cache_data(show_spinner=False)
+def _top10(df, col):
+    """Cached top-10 value counts for a categorical column
+
+    Zero-count categories (filtered-out regions/states/groups) are
+    dropped so filtered views don't pad out with empty rows.
+    """
+    counts = df[col].value_counts()
+    return counts[counts > 0].head(10)
+
 # Title
 st.title("📈 Exploratory Data Analysis")
-st.markdown("---")
+st.html(HR)
 
 # Load data
 df = load_cleaned_data()
@@ -34,17 +54,17 @@ st.sidebar.header("🔍 Filters")
 
 population_filter = st.sidebar.selectbox(
     "Population Group",
-    ["All"] + df['population_group'].unique().tolist()
+    ["All"] + get_unique_sorted(df, 'population_group')
 )
 
 region_filter = st.sidebar.selectbox(
     "Region",
-    ["All"] + sorted(df['region'].unique().tolist())
+    ["All"] + get_unique_sorted(df, 'region')
 )
 
 state_filter = st.sidebar.selectbox(
     "State",
-    ["All"] + sorted(df['state_name'].unique().tolist())
+    ["All"] + get_unique_sorted(df, 'state_name')
 )
 
 # Apply filters
@@ -55,6 +75,9 @@ filtered_df = filter_data(
     state=state_filter if state_filter != "All" else None
 )
 
+# Shared aggregates for all charts below (one scan per filter combination)
+aggs = compute_eda_aggregates(filtered_df)
+
 # Summary Statistics
 st.header("📊 Dataset Overview")
 
@@ -74,14 +97,14 @@ with col3:
 with col4:
     st.metric("Total Accounts", f"{stats['total_accounts']:,}")
 
-st.markdown("---")
+st.html(HR)
 
 # Data table
 with st.expander("📋 View Raw Data", expanded=False):
     st.dataframe(filtered_df, use_container_width=True, height=400)
     
     # Download button
-    csv = filtered_df.to_csv(index=False).encode('utf-8')
+    csv = to_csv_bytes(filtered_df)
     st.download_button(
         label="Download Filtered Data as CSV",
         data=csv,
@@ -89,7 +112,7 @@ with st.expander("📋 View Raw Data", expanded=False):
         mime="text/csv"
     )
 
-st.markdown("---")
+st.html(HR)
 
 # Statistical Summary
 st.header("📉 Statistical Summary")
@@ -97,18 +120,16 @@ st.header("📉 Statistical Summary")
 tab1, tab2 = st.tabs(["Numerical Features", "Categorical Features"])
 
 with tab1:
-    numerical_cols = ['no_of_offices', 'no_of_accounts', 'deposit_amount']
-    st.dataframe(filtered_df[numerical_cols].describe(), use_container_width=True)
-    
+    st.dataframe(_describe(filtered_df), use_container_width=True)
+
 with tab2:
     categorical_cols = ['state_name', 'region', 'population_group', 'district_name']
-    
+
     for col in categorical_cols:
         with st.expander(f"📌 {col.replace('_', ' ').title()}", expanded=False):
-            value_counts = filtered_df[col].value_counts().head(10)
-            st.dataframe(value_counts, use_container_width=True)
+            st.dataframe(_top10(filtered_df, col), use_container_width=True)
 
-st.markdown("---")
+st.html(HR)
 
 # Distributions
 st.header("📊 Distribution Analysis")
@@ -127,7 +148,7 @@ with col3:
     fig = create_distribution_plot(filtered_df, 'deposit_amount', 'Deposit Amount Distribution')
     st.plotly_chart(fig, use_container_width=True)
 
-st.markdown("---")
+st.html(HR)
 
 # Correlation Analysis
 st.header("🔗 Correlation Analysis")
@@ -136,19 +157,19 @@ col1, col2 = st.columns([1, 1])
 
 with col1:
     numerical_features = ['no_of_offices', 'no_of_accounts', 'deposit_amount']
-    fig = create_correlation_heatmap(filtered_df, numerical_features)
+    fig = create_correlation_heatmap(filtered_df, numerical_features, corr=aggs['corr'])
     st.plotly_chart(fig, use_container_width=True)
 
 with col2:
     st.markdown("### Key Correlations")
-    
-    corr = filtered_df[numerical_features].corr()
+
+    corr = aggs['corr']
     
     st.success(f"**Offices ↔ Accounts:** {corr.loc['no_of_offices', 'no_of_accounts']:.3f}")
     st.info(f"**Offices ↔ Deposits:** {corr.loc['no_of_offices', 'deposit_amount']:.3f}")
     st.warning(f"**Accounts ↔ Deposits:** {corr.loc['no_of_accounts', 'deposit_amount']:.3f}")
     
-    st.markdown("---")
+    st.html(HR)
     
     st.markdown("""
     **Insights:**
@@ -157,34 +178,27 @@ with col2:
     - More banking infrastructure → More accounts → Higher deposits
     """)
 
-st.markdown("---")
+st.html(HR)
 
 # Population Group Analysis
 st.header("🌆 Population Group Analysis")
 
-fig = create_population_group_chart(filtered_df)
+fig = create_population_group_chart(filtered_df, group_counts=aggs['group_counts'])
 st.plotly_chart(fig, use_container_width=True)
 
 # Detailed stats by population group
 st.markdown("### Statistics by Population Group")
-pop_stats = filtered_df.groupby('population_group').agg({
-    'deposit_amount': ['count', 'sum', 'mean', 'median'],
-    'no_of_offices': 'sum',
-    'no_of_accounts': 'sum'
-}).round(2)
-
-pop_stats.columns = ['Count', 'Total Deposits', 'Avg Deposits', 'Median Deposits', 'Total Offices', 'Total Accounts']
-st.dataframe(pop_stats, use_container_width=True)
+st.dataframe(aggs['pop_stats'], use_container_width=True)
 
-st.markdown("---")
+st.html(HR)
 
 # Regional Analysis
 st.header("🗺️ Regional Analysis")
 
-fig = create_regional_analysis(filtered_df)
+fig = create_regional_analysis(filtered_df, regional_stats=aggs['regional_stats'])
 st.plotly_chart(fig, use_container_width=True)
 
-st.markdown("---")
+st.html(HR)
 
 # Deposit Analysis by Category
 st.header("💰 Deposit Analysis by Category")
@@ -199,15 +213,15 @@ with col2:
     fig = create_box_plot_by_category(filtered_df, 'deposit_amount', 'region')
     st.plotly_chart(fig, use_container_width=True)
 
-st.markdown("---")
+st.html(HR)
 
 # Top States
 st.header("🏆 Top Performing States")
 
-fig = create_top_states_chart(filtered_df, top_n=15)
+fig = create_top_states_chart(filtered_df, top_n=15, top_states=aggs['top_states'])
 st.plotly_chart(fig, use_container_width=True)
 
-st.markdown("---")
+st.html(HR)
 
 # Footer
 st.info("💡 **Tip:** Use the filters in the sidebar to drill down into specific population groups, regions, or states!")
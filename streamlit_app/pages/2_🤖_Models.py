@@ -7,20 +7,23 @@ import pandas as pd
 import numpy as np
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
-# Add utils to path
-sys.path.append(str(Path(__file__).parent.parent))
-from utils.data_loader import load_model_comparison, load_best_model, load_featured_data
+# Make utils importable when the page runs standalone (no-op on reruns)
+_APP_DIR = str(Path(__file__).parent.parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+from utils.data_loader import load_model_comparison, load_best_model, load_featured_data, to_csv_bytes
 from utils.visualizations import (
     create_model_comparison_chart, create_scatter_r2_vs_time,
-    create_actual_vs_predicted
+    create_actual_vs_predicted, HR
 )
 
 st.set_page_config(page_title="ML Models - Deposits Analysis", page_icon="🤖", layout="wide")
 
 # Title
 st.title("🤖 Machine Learning Models")
-st.markdown("---")
+st.html(HR)
 
 # Load data
 comparison_df = load_model_comparison()
@@ -29,6 +32,26 @@ if comparison_df is None:
     st.error("Unable to load model comparison data.")
     st.stop()
 
+@st.cache_data(show_spinner=False)
+def model_rankings(df):
+    """Compute every ranking of the comparison table in one cached pass"""
+    return SimpleNamespace(
+        best_r2=df['test_r2'].max(),
+        best_model=df.loc[df['test_r2'].idxmax(), 'model_name'],
+        best_rmse=df['test_rmse'].min(),
+        top_15_rmse=df.nsmallest(15, 'test_rmse'),
+        top_5_r2=df.nlargest(5, 'test_r2')[['model_name', 'test_r2']],
+        top_5_speed=df.nsmallest(5, 'training_time')[['model_name', 'training_time']],
+        top_5_rmse=df.nsmallest(5, 'test_rmse')[['model_name', 'test_rmse']],
+    )
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def sorted_view(df, sort_by, ascending, top_n):
+    """Cache the user-selected sort of the comparison table"""
+    return df.sort_values(sort_by, ascending=ascending).head(top_n)
+
+rankings = model_rankings(comparison_df)
+
 # Overview
 st.header("📊 Models Overview")
 
@@ -38,18 +61,17 @@ with col1:
     st.metric("Total Models Trained", len(comparison_df))
 
 with col2:
-    best_r2 = comparison_df['test_r2'].max()
+    best_r2 = rankings.best_r2
     st.metric("Best R² Score", f"{best_r2:.4f}")
 
 with col3:
-    best_model_name = comparison_df.loc[comparison_df['test_r2'].idxmax(), 'model_name']
+    best_model_name = rankings.best_model
     st.metric("Best Model", best_model_name)
 
 with col4:
-    best_rmse = comparison_df['test_rmse'].min()
-    st.metric("Best RMSE", f"₹{best_rmse:,.2f}")
+    st.metric("Best RMSE", f"₹{rankings.best_rmse:,.2f}")
 
-st.markdown("---")
+st.html(HR)
 
 # Model Categories
 st.header("🎯 Model Categories")
@@ -101,7 +123,7 @@ with col3:
     </div>
     """, unsafe_allow_html=True)
 
-st.markdown("---")
+st.html(HR)
 
 # Model Performance Comparison
 st.header("📈 Model Performance Comparison")
@@ -109,37 +131,43 @@ st.header("📈 Model Performance Comparison")
 # Interactive table
 st.subheader("🔍 Detailed Model Metrics")
 
-# Add filters
-col1, col2, col3 = st.columns(3)
+# Add filters - batched in a form so dragging the slider doesn't trigger a
+# rerun per tick
+with st.form("sort_controls"):
+    col1, col2, col3 = st.columns(3)
 
-with col1:
-    sort_by = st.selectbox(
-        "Sort by",
-        ['test_r2', 'test_rmse', 'test_mae', 'training_time']
-    )
+    with col1:
+        sort_by = st.selectbox(
+            "Sort by",
+            ['test_r2', 'test_rmse', 'test_mae', 'training_time']
+        )
 
-with col2:
-    ascending = st.checkbox("Ascending Order", value=False)
+    with col2:
+        ascending = st.checkbox("Ascending Order", value=False)
 
-with col3:
-    show_top_n = st.slider("Show top N models", 5, len(comparison_df), 15)
+    with col3:
+        show_top_n = st.slider("Show top N models", 5, len(comparison_df), 15)
+
+    st.form_submit_button("Apply")
 
 # Sort and filter
-sorted_df = comparison_df.sort_values(sort_by, ascending=ascending).head(show_top_n)
+sorted_df = sorted_view(comparison_df, sort_by, ascending, show_top_n)
 
-# Display table
+# Display table - column_config handles the plain numeric columns
+# client-side; the rupee columns keep a Styler pass because sprintf-style
+# formats can't do thousands grouping, and the view is at most ~18 rows
 st.dataframe(
-    sorted_df[['model_name', 'test_r2', 'test_rmse', 'test_mae', 'training_time']].style.format({
-        'test_r2': '{:.4f}',
-        'test_rmse': '₹{:,.2f}',
-        'test_mae': '₹{:,.2f}',
-        'training_time': '{:.4f}s'
-    }),
+    sorted_df[['model_name', 'test_r2', 'test_rmse', 'test_mae', 'training_time']]
+    .style.format({'test_rmse': '₹{:,.2f}', 'test_mae': '₹{:,.2f}'}),
+    column_config={
+        'test_r2': st.column_config.NumberColumn(format='%.4f'),
+        'training_time': st.column_config.NumberColumn(format='%.4fs'),
+    },
     use_container_width=True,
     height=400
 )
 
-st.markdown("---")
+st.html(HR)
 
 # Visualizations
 st.header("📊 Performance Visualizations")
@@ -166,7 +194,7 @@ with tab2:
     """)
 
 with tab3:
-    top_15_rmse = comparison_df.nsmallest(15, 'test_rmse')
+    top_15_rmse = rankings.top_15_rmse
     
     import plotly.graph_objects as go
     fig = go.Figure()
@@ -188,7 +216,7 @@ with tab3:
     )
     st.plotly_chart(fig, use_container_width=True)
 
-st.markdown("---")
+st.html(HR)
 
 # Best Model Showcase
 st.header("🏆 Best Model: Extra Trees Regressor")
@@ -239,7 +267,7 @@ with col2:
     
     st.success("🎯 **Recommended for Production Deployment**")
 
-st.markdown("---")
+st.html(HR)
 
 # Predictions visualization (if model available)
 try:
@@ -267,7 +295,7 @@ try:
 except Exception as e:
     st.warning(f"Model predictions not available for visualization: {str(e)}")
 
-st.markdown("---")
+st.html(HR)
 
 # Model Comparison Summary
 st.header("📋 Model Comparison Summary")
@@ -275,29 +303,35 @@ st.header("📋 Model Comparison Summary")
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    st.markdown("### Top 5 by R² Score")
-    top_5_r2 = comparison_df.nlargest(5, 'test_r2')[['model_name', 'test_r2']]
-    for idx, (_, row) in enumerate(top_5_r2.iterrows(), 1):
-        st.write(f"{idx}. **{row['model_name']}** - {row['test_r2']:.4f}")
+    top_5_r2 = rankings.top_5_r2
+    st.markdown("### Top 5 by R² Score\n" + "\n".join(
+        f"{idx}. **{name}** - {r2:.4f}"
+        for idx, (name, r2) in enumerate(
+            zip(top_5_r2['model_name'].to_numpy(), top_5_r2['test_r2'].to_numpy()), 1)
+    ))
 
 with col2:
-    st.markdown("### Fastest Training")
-    top_5_speed = comparison_df.nsmallest(5, 'training_time')[['model_name', 'training_time']]
-    for idx, (_, row) in enumerate(top_5_speed.iterrows(), 1):
-        st.write(f"{idx}. **{row['model_name']}** - {row['training_time']:.4f}s")
+    top_5_speed = rankings.top_5_speed
+    st.markdown("### Fastest Training\n" + "\n".join(
+        f"{idx}. **{name}** - {t:.4f}s"
+        for idx, (name, t) in enumerate(
+            zip(top_5_speed['model_name'].to_numpy(), top_5_speed['training_time'].to_numpy()), 1)
+    ))
 
 with col3:
-    st.markdown("### Lowest RMSE")
-    top_5_rmse = comparison_df.nsmallest(5, 'test_rmse')[['model_name', 'test_rmse']]
-    for idx, (_, row) in enumerate(top_5_rmse.iterrows(), 1):
-        st.write(f"{idx}. **{row['model_name']}** - ₹{row['test_rmse']:,.2f}")
+    top_5_rmse = rankings.top_5_rmse
+    st.markdown("### Lowest RMSE\n" + "\n".join(
+        f"{idx}. **{name}** - ₹{rmse:,.2f}"
+        for idx, (name, rmse) in enumerate(
+            zip(top_5_rmse['model_name'].to_numpy(), top_5_rmse['test_rmse'].to_numpy()), 1)
+    ))
 
-st.markdown("---")
+st.html(HR)
 
 # Download results
 st.header("💾 Download Model Results")
 
-csv = comparison_df.to_csv(index=False).encode('utf-8')
+csv = to_csv_bytes(comparison_df)
 st.download_button(
     label="📥 Download Full Model Comparison (CSV)",
     data=csv,
@@ -11,11 +11,24 @@ from pathlib import Path
 # Add utils to path
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.data_loader import (
-    load_best_model, get_population_groups, get_regions, 
-    get_states, get_districts, load_cleaned_data
+    get_population_groups, get_regions,
+    get_states, get_districts, load_cleaned_data, regional_sums,
+    reference_stats
 )
+from utils.predict_kernels import batch_predict, predict_from_table
+from utils.styles import inject_card_css
 
 st.set_page_config(page_title="Prediction Tool", page_icon="🎯", layout="wide")
+inject_card_css()
+
+# Accounts-per-office thresholds, classified branchlessly via np.digitize so
+# the same bins drive single predictions and batch what-if sweeps
+RATIO_BINS = np.array([10.0, 15.0])
+RATIO_MESSAGES = (
+    (st.warning, "⚠️ Low accounts per office ratio suggests potential for account acquisition growth."),
+    (None, None),
+    (st.success, "✅ Above-average accounts per office ratio indicates good operational efficiency!"),
+)
 
 # Title
 st.title("🎯 Deposit Amount Prediction Tool")
@@ -38,66 +51,71 @@ if df is None:
     st.error("Unable to load reference data.")
     st.stop()
 
-# Calculate reference statistics
-avg_offices = df['no_of_offices'].mean()
-avg_accounts = df['no_of_accounts'].mean()
-avg_deposits = df['deposit_amount'].mean()
+# Reference statistics: one cached .agg pass over the frame
+stats = reference_stats(df)
+avg_offices = stats['avg_offices']
+avg_accounts = stats['avg_accounts']
+avg_deposits = stats['avg_deposits']
 
-# Input Form
+# Input Form - batched so editing a field doesn't rerun the whole script,
+# only submitting does
 st.header("📝 Enter Banking Details")
 
-col1, col2 = st.columns(2)
+with st.form("predict_form"):
+    col1, col2 = st.columns(2)
 
-with col1:
-    st.subheader("Infrastructure")
-    
-    no_of_offices = st.number_input(
-        "Number of Offices",
-        min_value=1,
-        max_value=int(df['no_of_offices'].max()),
-        value=int(avg_offices),
-        step=1,
-        help=f"Average: {avg_offices:.0f} offices"
-    )
-    
-    no_of_accounts = st.number_input(
-        "Number of Accounts",
-        min_value=1,
-        max_value=int(df['no_of_accounts'].max()),
-        value=int(avg_accounts),
-        step=100,
-        help=f"Average: {avg_accounts:.0f} accounts"
-    )
-    
-    st.metric("Accounts per Office", f"{no_of_accounts/no_of_offices:.2f}")
+    with col1:
+        st.subheader("Infrastructure")
 
-with col2:
-    st.subheader("Location Details")
-    
-    population_group = st.selectbox(
-        "Population Group",
-        get_population_groups()
-    )
-    
-    region = st.selectbox(
-        "Region",
-        get_regions()
-    )
-    
-    state = st.selectbox(
-        "State",
-        get_states()
-    )
-    
-    district = st.selectbox(
-        "District",
-        get_districts(state)
-    )
+        no_of_offices = st.number_input(
+            "Number of Offices",
+            min_value=1,
+            max_value=stats['max_offices'],
+            value=int(avg_offices),
+            step=1,
+            help=f"Average: {avg_offices:.0f} offices"
+        )
+
+        no_of_accounts = st.number_input(
+            "Number of Accounts",
+            min_value=1,
+            max_value=stats['max_accounts'],
+            value=int(avg_accounts),
+            step=100,
+            help=f"Average: {avg_accounts:.0f} accounts"
+        )
+
+        st.metric("Accounts per Office", f"{no_of_accounts/no_of_offices:.2f}")
+
+    with col2:
+        st.subheader("Location Details")
+
+        population_group = st.selectbox(
+            "Population Group",
+            get_population_groups()
+        )
+
+        region = st.selectbox(
+            "Region",
+            get_regions()
+        )
+
+        state = st.selectbox(
+            "State",
+            get_states()
+        )
+
+        district = st.selectbox(
+            "District",
+            get_districts(state)
+        )
+
+    submitted = st.form_submit_button("🔮 Predict Deposit Amount", type="primary")
 
 st.markdown("---")
 
-# Prediction Button
-if st.button("🔮 Predict Deposit Amount", type="primary"):
+# Prediction
+if submitted:
     with st.spinner("Calculating prediction..."):
         # Note: This is a simplified prediction example
         # In production, you'd need:
@@ -107,23 +125,38 @@ if st.button("🔮 Predict Deposit Amount", type="primary"):
         
         # For demonstration, we'll use a simple estimation based on similar records
         # In real deployment, load the actual model and use its predict method
-        
-        # Find similar records
-        similar_records = df[
-            (df['population_group'] == population_group) &
-            (df['region'] == region)
-        ]
-        
-        if len(similar_records) > 0:
+
+        # Look up similar records in the cached (population_group, region)
+        # table; ratios are memoised in session_state so re-predicting the
+        # same combination is a plain dict hit with no hashing at all
+        key = (population_group, region)
+        pred_cache = st.session_state.setdefault('pred_cache', {})
+        if key not in pred_cache:
+            sums = regional_sums(df)
+            if key in sums.index:
+                row = sums.loc[key]
+                pred_cache[key] = (
+                    row['deposit_amount'] / row['no_of_offices'],
+                    row['deposit_amount'] / row['no_of_accounts'],
+                    int(row['record_count']),
+                )
+            else:
+                pred_cache[key] = None
+
+        cached = pred_cache[key]
+        n_similar = cached[2] if cached is not None else 0
+
+        if n_similar > 0:
             # Calculate prediction based on linear relationship from similar records
-            avg_deposit_per_office = similar_records['deposit_amount'].sum() / similar_records['no_of_offices'].sum()
-            avg_deposit_per_account = similar_records['deposit_amount'].sum() / similar_records['no_of_accounts'].sum()
-            
-            # Weighted prediction
-            predicted_deposit = (
-                (no_of_offices * avg_deposit_per_office * 0.5) +
-                (no_of_accounts * avg_deposit_per_account * 0.5)
-            )
+            avg_deposit_per_office, avg_deposit_per_account, n_similar = cached
+
+            # Weighted prediction (kernel handles batch sweeps too)
+            predicted_deposit = float(batch_predict(
+                np.array([no_of_offices], dtype=np.float64),
+                np.array([no_of_accounts], dtype=np.float64),
+                np.array([avg_deposit_per_office], dtype=np.float64),
+                np.array([avg_deposit_per_account], dtype=np.float64),
+            )[0])
             
             st.success("✅ Prediction Complete!")
             
@@ -131,43 +164,28 @@ if st.button("🔮 Predict Deposit Amount", type="primary"):
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                st.markdown(f"""
-                <div style="padding: 2rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                            border-radius: 10px; color: white; text-align: center;">
-                    <h3>Predicted Deposit</h3>
-                    <p style="font-size: 2.5rem; font-weight: bold; margin: 1rem 0;">
-                        ₹{predicted_deposit:,.0f}
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
-            
+                st.markdown(
+                    f'<div class="card-violet"><h3>Predicted Deposit</h3>'
+                    f'<p class="big">₹{predicted_deposit:,.0f}</p></div>',
+                    unsafe_allow_html=True)
+
             with col2:
                 comparison_avg = ((predicted_deposit - avg_deposits) / avg_deposits) * 100
                 color = "green" if comparison_avg > 0 else "red"
                 arrow = "↑" if comparison_avg > 0 else "↓"
-                
-                st.markdown(f"""
-                <div style="padding: 2rem; background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); 
-                            border-radius: 10px; color: white; text-align: center;">
-                    <h3>vs Average</h3>
-                    <p style="font-size: 2.5rem; font-weight: bold; margin: 1rem 0; color: {color};">
-                        {arrow} {abs(comparison_avg):.1f}%
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
-            
+
+                st.markdown(
+                    f'<div class="card-pink"><h3>vs Average</h3>'
+                    f'<p class="big" style="color: {color};">{arrow} {abs(comparison_avg):.1f}%</p></div>',
+                    unsafe_allow_html=True)
+
             with col3:
-                confidence = 85 if len(similar_records) > 10 else 70
-                
-                st.markdown(f"""
-                <div style="padding: 2rem; background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); 
-                            border-radius: 10px; color: white; text-align: center;">
-                    <h3>Confidence</h3>
-                    <p style="font-size: 2.5rem; font-weight: bold; margin: 1rem 0;">
-                        {confidence}%
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+                confidence = 85 if n_similar > 10 else 70
+
+                st.markdown(
+                    f'<div class="card-blue"><h3>Confidence</h3>'
+                    f'<p class="big">{confidence}%</p></div>',
+                    unsafe_allow_html=True)
             
             st.markdown("---")
             
@@ -191,7 +209,7 @@ if st.button("🔮 Predict Deposit Amount", type="primary"):
                 st.write(f"**Average Deposit:** ₹{avg_deposits:,.0f}")
                 st.write(f"**Deposit per Office:** ₹{predicted_deposit/no_of_offices:,.0f}")
                 st.write(f"**Deposit per Account:** ₹{predicted_deposit/no_of_accounts:,.0f}")
-                st.write(f"**Similar Records Found:** {len(similar_records):,}")
+                st.write(f"**Similar Records Found:** {n_similar:,}")
             
             st.markdown("---")
             
@@ -203,10 +221,10 @@ if st.button("🔮 Predict Deposit Amount", type="primary"):
             elif population_group == "Rural":
                 st.warning("🌾 Rural areas generally show lower deposit amounts but represent significant growth potential for financial inclusion.")
             
-            if no_of_accounts / no_of_offices > 15:
-                st.success("✅ Above-average accounts per office ratio indicates good operational efficiency!")
-            elif no_of_accounts / no_of_offices < 10:
-                st.warning("⚠️ Low accounts per office ratio suggests potential for account acquisition growth.")
+            band = int(np.digitize(no_of_accounts / no_of_offices, RATIO_BINS, right=True))
+            render, message = RATIO_MESSAGES[band]
+            if render is not None:
+                render(message)
             
         else:
             st.error("No similar records found for this combination. Please try different parameters.")
@@ -220,28 +238,40 @@ st.info("Compare multiple scenarios side-by-side to understand the impact of dif
 
 num_scenarios = st.slider("Number of scenarios to compare", 2, 4, 2)
 
+# First pass: collect scenario inputs, batched in a form so tweaking one
+# field doesn't rerun the page per keystroke
+with st.form("scenario_form"):
+    scenario_cols = st.columns(num_scenarios)
+
+    scenario_inputs = []
+    for idx, col in enumerate(scenario_cols):
+        with col:
+            st.markdown(f"### Scenario {idx + 1}")
+
+            with st.expander(f"Configure Scenario {idx + 1}", expanded=False):
+                s_offices = st.number_input(f"Offices (S{idx+1})", min_value=1, value=int(avg_offices)*(idx+1), key=f"offices_{idx}")
+                s_accounts = st.number_input(f"Accounts (S{idx+1})", min_value=1, value=int(avg_accounts)*(idx+1), key=f"accounts_{idx}")
+                s_pop_group = st.selectbox(f"Pop Group (S{idx+1})", get_population_groups(), key=f"pop_{idx}")
+                s_region = st.selectbox(f"Region (S{idx+1})", get_regions(), key=f"region_{idx}")
+                scenario_inputs.append((s_offices, s_accounts, s_pop_group, s_region))
+
+    st.form_submit_button("Compare Scenarios")
+
 scenario_cols = st.columns(num_scenarios)
 
-for idx, col in enumerate(scenario_cols):
+# One vectorised batch prediction for all scenarios, through the same
+# weighted kernel the single-prediction path uses
+sdf = pd.DataFrame(scenario_inputs, columns=['offices', 'accounts', 'population_group', 'region'])
+predictions = predict_from_table(
+    sdf['offices'].to_numpy(), sdf['accounts'].to_numpy(),
+    sdf['population_group'], sdf['region'],
+    regional_sums(df), avg_deposits)
+
+# Second pass: render the metrics
+for col, offices_i, pred_i in zip(scenario_cols, sdf['offices'].to_numpy(), predictions):
     with col:
-        st.markdown(f"### Scenario {idx + 1}")
-        
-        with st.expander(f"Configure Scenario {idx + 1}", expanded=False):
-            s_offices = st.number_input(f"Offices (S{idx+1})", min_value=1, value=int(avg_offices)*(idx+1), key=f"offices_{idx}")
-            s_accounts = st.number_input(f"Accounts (S{idx+1})", min_value=1, value=int(avg_accounts)*(idx+1), key=f"accounts_{idx}")
-            s_pop_group = st.selectbox(f"Pop Group (S{idx+1})", get_population_groups(), key=f"pop_{idx}")
-            s_region = st.selectbox(f"Region (S{idx+1})", get_regions(), key=f"region_{idx}")
-            
-            # Simple prediction for scenario
-            similar = df[(df['population_group'] == s_pop_group) & (df['region'] == s_region)]
-            if len(similar) > 0:
-                avg_per_office = similar['deposit_amount'].sum() / similar['no_of_offices'].sum()
-                s_prediction = s_offices * avg_per_office
-            else:
-                s_prediction = avg_deposits
-            
-            st.metric("Predicted Deposit", f"₹{s_prediction:,.0f}")
-            st.metric("Per Office", f"₹{s_prediction/s_offices:,.0f}")
+        st.metric("Predicted Deposit", f"₹{pred_i:,.0f}")
+        st.metric("Per Office", f"₹{pred_i/offices_i:,.0f}")
 
 st.markdown("---")
 
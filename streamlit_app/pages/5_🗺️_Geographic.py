@@ -2,7 +2,9 @@
 Geographic Insights Page
 """
 
+import json
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -16,6 +18,267 @@ from utils.visualizations import COLORS
 
 st.set_page_config(page_title="Geographic Insights", page_icon="🗺️", layout="wide")
 
+# Charts on this page are read-only; dropping the mode bar trims the
+# per-chart frontend wiring
+_PLOTLY_CONFIG = {'displayModeBar': False, 'responsive': True}
+
+# The page only ever aggregates the frame from load_cleaned_data, which is
+# a cache_resource singleton (one object per data version), so identity is
+# a stable cache key and skips the O(rows x cols) content hash. Do not use
+# this for helpers taking per-rerun filtered frames.
+_DF_HASH = {pd.DataFrame: id}
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _overview_counts(df):
+    """Unique counts for the overview cards
+
+    Categorical columns read len(categories) - O(1) - instead of a full
+    nunique scan; the loader builds categories from the data itself, so
+    the two are equivalent here.
+    """
+    def _n(col):
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            return s.cat.categories.size
+        return s.nunique()
+    return _n('state_name'), _n('district_name'), _n('region'), df['deposit_amount'].sum()
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _region_full(df):
+    """One fused region pass feeding every region-level view on the page"""
+    return df.groupby('region', observed=True, sort=False).agg(
+        deposit_sum=('deposit_amount', 'sum'),
+        deposit_mean=('deposit_amount', 'mean'),
+        records=('deposit_amount', 'count'),
+        offices=('no_of_offices', 'sum'),
+        accounts=('no_of_accounts', 'sum'),
+    )
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _regional_agg(df):
+    """Region-level totals behind the Regional Performance section"""
+    regional_data = _region_full(df).copy()
+    regional_data.columns = ['Total Deposits', 'Avg Deposits', 'Records', 'Total Offices', 'Total Accounts']
+    regional_data = regional_data.reset_index()
+    return regional_data.sort_values('Total Deposits', ascending=False)
+
+def _comparison_aggs(df, selected_regions):
+    """Per-region sums for the comparison tool - a row subset of the fused
+    table, so no rescan of the raw frame per selection change"""
+    full = _region_full(df)
+    if len(selected_regions) == len(full.index):
+        # Everything selected: reuse the fused table as-is
+        sums = full[['deposit_sum', 'offices', 'accounts']]
+    else:
+        sums = full.loc[list(selected_regions), ['deposit_sum', 'offices', 'accounts']]
+    return sums.rename(columns={
+        'deposit_sum': 'deposit_amount',
+        'offices': 'no_of_offices',
+        'accounts': 'no_of_accounts',
+    })
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _state_aggs(df):
+    """State-level deposit totals and the performance-detail table"""
+    state_deposits = df.groupby('state_name', observed=True, sort=False)['deposit_amount'].sum().nlargest(15)
+    state_details = df.groupby('state_name', observed=True, sort=False).agg({
+        'deposit_amount': ['sum', 'mean'],
+        'no_of_offices': 'sum',
+        'no_of_accounts': 'sum',
+        'district_name': 'nunique'
+    })
+    state_details.columns = ['Total Deposits', 'Avg Deposits', 'Offices', 'Accounts', 'Districts']
+    state_details = state_details.nlargest(15, 'Total Deposits')
+    return state_deposits, state_details
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _district_summary(df):
+    """One per-district summary table the search matches against
+
+    Built once, so each keystroke scans a few hundred district names
+    instead of every raw row.
+    """
+    return df.groupby('district_name', observed=True, sort=False).agg(
+        deposit_amount=('deposit_amount', 'sum'),
+        no_of_offices=('no_of_offices', 'sum'),
+        no_of_accounts=('no_of_accounts', 'sum'),
+        state_name=('state_name', 'first'),
+        region=('region', 'first'),
+        records=('deposit_amount', 'count'),
+    ).reset_index()
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _district_name_index(df):
+    """Lowercased sorted district names plus their summary-row positions"""
+    lower = _district_summary(df)['district_name'].str.lower().to_numpy()
+    order = np.argsort(lower)
+    return lower[order], order
+
+def _district_search(df, search):
+    """Match the search term against the district summary
+
+    Substring semantics, same as the baseline - suffix terms like "pur"
+    or "nagar" are the common case for district names. The scan runs
+    over the cached lowercased name array, so a keystroke costs one
+    np.char.find over ~700 names instead of re-lowercasing the column.
+    """
+    summary = _district_summary(df)
+    term = search.lower()
+    names, order = _district_name_index(df)
+    hits = np.char.find(names, term) >= 0
+    if not hits.any():
+        return 0, None
+    matched = summary.iloc[np.sort(order[hits])]
+    return int(matched['records'].sum()), matched
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _top_bottom_districts(df):
+    """Top and bottom ten districts by total deposits"""
+    district_sums = df.groupby('district_name', observed=True, sort=False).agg({
+        'deposit_amount': 'sum',
+        'state_name': 'first'
+    })
+    top = district_sums.nlargest(10, 'deposit_amount')
+    bottom = district_sums.nsmallest(10, 'deposit_amount')
+    return top, bottom
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _metric_cols(df):
+    """All three per-record efficiency ratios, built in one cached pass
+
+    The selectbox domain is fixed, so partial-evaluating every option up
+    front (sharing the zero-guarded denominators) makes switching metrics
+    free after the first render.
+    """
+    safe_offices = df['no_of_offices'].replace(0, 1)
+    return {
+        "Accounts per Office": (df['no_of_accounts'] / safe_offices).astype('float32'),
+        "Deposit per Office": (df['deposit_amount'] / safe_offices).astype('float32'),
+        "Deposit per Account": (df['deposit_amount'] / df['no_of_accounts'].replace(0, 1)).astype('float32'),
+    }
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _efficiency_means(df, efficiency_metric):
+    """Mean per-record efficiency ratio by region/population group/state
+
+    Keeps the original mean-of-ratios semantics (a ratio of aggregated
+    sums would weight large records more) and never writes a column onto
+    the shared frame.
+    """
+    metric = _metric_cols(df)[efficiency_metric]
+    region_eff = metric.groupby(df['region'], observed=True, sort=False).mean().sort_values(ascending=False)
+    pop_eff = metric.groupby(df['population_group'], observed=True, sort=False).mean().sort_values(ascending=False)
+    state_eff = metric.groupby(df['state_name'], observed=True, sort=False).mean().nlargest(15)
+    return region_eff, pop_eff, state_eff
+
+# The charts below depend only on the dataset, yet were rebuilt and
+# re-serialized on every rerun (each keystroke in the search box). Caching
+# the figure JSON skips both construction and serialization; the cached
+# string parses straight into st.plotly_chart.
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _regional_bar_json(df):
+    """Total-deposits-by-region bar chart, serialized once"""
+    regional_data = _regional_agg(df)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=regional_data['region'],
+        y=regional_data['Total Deposits'],
+        marker_color=COLORS['primary'],
+        text='₹' + (regional_data['Total Deposits'] / 1e9).round(1).astype(str) + 'B',
+        textposition='outside',
+        name='Total Deposits'
+    ))
+    fig.update_layout(
+        title="Total Deposits by Region",
+        xaxis_title="Region",
+        yaxis_title="Total Deposits (₹)",
+        height=400,
+        showlegend=False
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _state_bar_json(df):
+    """Top-15-states bar chart, serialized once"""
+    state_deposits, _ = _state_aggs(df)
+    fig = go.Figure(go.Bar(
+        x=state_deposits.values,
+        y=state_deposits.index,
+        orientation='h',
+        marker_color=COLORS['secondary'],
+        text='₹' + (state_deposits / 1e6).round(1).astype(str) + 'M',
+        textposition='outside'
+    ))
+    fig.update_layout(
+        title="Top 15 States",
+        xaxis_title="Total Deposits (₹)",
+        yaxis_title="State",
+        height=500,
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _state_heatmap_json(df):
+    """Normalized state performance heatmap, serialized once"""
+    _, state_details = _state_aggs(df)
+    # One min-max broadcast over the whole matrix instead of per-column loops
+    arr = state_details.to_numpy(dtype=np.float32)
+    mn = arr.min(axis=0)
+    span = arr.max(axis=0) - mn
+    norm = (arr - mn) / np.where(span == 0, 1, span)
+    fig = go.Figure(data=go.Heatmap(
+        z=norm.T,
+        x=state_details.index,
+        y=state_details.columns,
+        colorscale='Blues',
+        text=state_details.values.T,
+        texttemplate='%{text:.0f}',
+        textfont={"size": 10},
+        colorbar=dict(title="Normalized<br>Score")
+    ))
+    fig.update_layout(
+        title="State Performance Heatmap (Top 15)",
+        height=500,
+        xaxis={'side': 'bottom'},
+        yaxis={'side': 'left'}
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _district_bars_json(df):
+    """Top/bottom-10 district bar charts, serialized once"""
+    top_districts, bottom_districts = _top_bottom_districts(df)
+    top_fig = go.Figure(go.Bar(
+        x=top_districts['deposit_amount'],
+        y=top_districts.index.astype(str) + ' (' + top_districts['state_name'].astype(str) + ')',
+        orientation='h',
+        marker_color=COLORS['success'],
+        text='₹' + (top_districts['deposit_amount'] / 1e6).round(1).astype(str) + 'M',
+        textposition='outside'
+    ))
+    top_fig.update_layout(
+        title="Top 10 Districts by Total Deposits",
+        xaxis_title="Total Deposits (₹)",
+        height=400,
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    bottom_fig = go.Figure(go.Bar(
+        x=bottom_districts['deposit_amount'],
+        y=bottom_districts.index.astype(str) + ' (' + bottom_districts['state_name'].astype(str) + ')',
+        orientation='h',
+        marker_color=COLORS['danger'],
+        text='₹' + (bottom_districts['deposit_amount'] / 1e3).round(1).astype(str) + 'K',
+        textposition='outside'
+    ))
+    bottom_fig.update_layout(
+        title="Bottom 10 Districts by Total Deposits",
+        xaxis_title="Total Deposits (₹)",
+        height=400,
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    return top_fig.to_json(), bottom_fig.to_json()
+
 # Title
 st.title("🗺️ Geographic Insights")
 st.markdown("---")
@@ -30,6 +293,8 @@ if df is None:
 # Overview Metrics
 st.header("📊 Geographic Overview")
 
+n_states, n_districts, n_regions, total_deposits = _overview_counts(df)
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
@@ -38,7 +303,7 @@ with col1:
                 border-radius: 10px; color: white; text-align: center;">
         <h4>Total States</h4>
         <p style="font-size: 2rem; font-weight: bold; margin: 0.5rem 0;">
-            {df['state_name'].nunique()}
+            {n_states}
         </p>
         <p style="font-size: 0.9rem;">Across India</p>
     </div>
@@ -50,7 +315,7 @@ with col2:
                 border-radius: 10px; color: white; text-align: center;">
         <h4>Total Districts</h4>
         <p style="font-size: 2rem; font-weight: bold; margin: 0.5rem 0;">
-            {df['district_name'].nunique()}
+            {n_districts}
         </p>
         <p style="font-size: 0.9rem;">Coverage Area</p>
     </div>
@@ -62,14 +327,13 @@ with col3:
                 border-radius: 10px; color: white; text-align: center;">
         <h4>Total Regions</h4>
         <p style="font-size: 2rem; font-weight: bold; margin: 0.5rem 0;">
-            {df['region'].nunique()}
+            {n_regions}
         </p>
         <p style="font-size: 0.9rem;">Geographic Zones</p>
     </div>
     """, unsafe_allow_html=True)
 
 with col4:
-    total_deposits = df['deposit_amount'].sum()
     st.markdown(f"""
     <div style="padding: 1rem; background: linear-gradient(135deg, {COLORS['secondary']} 0%, #7c3aed 100%); 
                 border-radius: 10px; color: white; text-align: center;">
@@ -89,71 +353,50 @@ st.header("🌍 Regional Performance")
 col1, col2 = st.columns([3, 2])
 
 with col1:
-    # Regional aggregate
-    regional_data = df.groupby('region').agg({
-        'deposit_amount': ['sum', 'mean', 'count'],
-        'no_of_offices': 'sum',
-        'no_of_accounts': 'sum'
-    }).round(2)
-    
-    regional_data.columns = ['Total Deposits', 'Avg Deposits', 'Records', 'Total Offices', 'Total Accounts']
-    regional_data = regional_data.reset_index()
-    regional_data = regional_data.sort_values('Total Deposits', ascending=False)
-    
-    # Bar chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        x=regional_data['region'],
-        y=regional_data['Total Deposits'],
-        marker_color=COLORS['primary'],
-        text=regional_data['Total Deposits'].apply(lambda x: f'₹{x/1e9:.1f}B'),
-        textposition='outside',
-        name='Total Deposits'
-    ))
-    
-    fig.update_layout(
-        title="Total Deposits by Region",
-        xaxis_title="Region",
-        yaxis_title="Total Deposits (₹)",
-        height=400,
-        showlegend=False
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    # Regional aggregate (cached)
+    regional_data = _regional_agg(df)
+
+    # Bar chart (cached JSON)
+    st.plotly_chart(json.loads(_regional_bar_json(df)), use_container_width=True, config=_PLOTLY_CONFIG)
 
 with col2:
     st.markdown("### Regional Statistics")
     
-    # Display table
-    display_df = regional_data.copy()
-    display_df['Total Deposits'] = display_df['Total Deposits'].apply(lambda x: f'₹{x/1e6:.1f}M')
-    display_df['Avg Deposits'] = display_df['Avg Deposits'].apply(lambda x: f'₹{x:,.0f}')
-    display_df['Total Offices'] = display_df['Total Offices'].apply(lambda x: f'{int(x):,}')
-    display_df['Total Accounts'] = display_df['Total Accounts'].apply(lambda x: f'{int(x):,}')
-    
-    st.dataframe(display_df, use_container_width=True, hide_index=True)
+    # Display table - one format spec instead of four frame-copying applies
+    st.dataframe(
+        regional_data.style.format({
+            'Total Deposits': lambda x: f'₹{x/1e6:.1f}M',
+            'Avg Deposits': '₹{:,.0f}',
+            'Total Offices': '{:,.0f}',
+            'Total Accounts': '{:,.0f}',
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
 
 # Regional Comparison Tool
 st.markdown("---")
 st.header("📊 Regional Comparison Tool")
 
 regions = get_regions()
+# Pin the default once per session so the multiselect key stays stable
+default_regions = st.session_state.setdefault(
+    'default_regions', regions[:3] if len(regions) >= 3 else regions)
 selected_regions = st.multiselect(
     "Select regions to compare:",
     options=regions,
-    default=regions[:3] if len(regions) >= 3 else regions
+    default=default_regions
 )
 
 if selected_regions:
-    comparison_df = df[df['region'].isin(selected_regions)]
-    
+    comparison_sums = _comparison_aggs(df, tuple(selected_regions))
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         # Deposits comparison
-        deposits_by_region = comparison_df.groupby('region')['deposit_amount'].sum().reset_index()
-        
+        deposits_by_region = comparison_sums['deposit_amount'].reset_index()
+
         fig = px.pie(
             deposits_by_region,
             values='deposit_amount',
@@ -163,15 +406,12 @@ if selected_regions:
         )
         
         fig.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
     
     with col2:
         # Infrastructure comparison
-        infra_comparison = comparison_df.groupby('region').agg({
-            'no_of_offices': 'sum',
-            'no_of_accounts': 'sum'
-        }).reset_index()
-        
+        infra_comparison = comparison_sums[['no_of_offices', 'no_of_accounts']].reset_index()
+
         fig = go.Figure()
         
         fig.add_trace(go.Bar(
@@ -196,20 +436,16 @@ if selected_regions:
             height=400
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
     
     # Efficiency metrics
     st.subheader("Efficiency Metrics Comparison")
     
-    efficiency_df = comparison_df.groupby('region').agg({
-        'deposit_amount': 'sum',
-        'no_of_offices': 'sum',
-        'no_of_accounts': 'sum'
-    })
-    
-    efficiency_df['Deposit per Office'] = (efficiency_df['deposit_amount'] / efficiency_df['no_of_offices']).round(2)
-    efficiency_df['Deposit per Account'] = (efficiency_df['deposit_amount'] / efficiency_df['no_of_accounts']).round(2)
-    efficiency_df['Accounts per Office'] = (efficiency_df['no_of_accounts'] / efficiency_df['no_of_offices']).round(2)
+    efficiency_df = comparison_sums.copy()
+
+    efficiency_df['Deposit per Office'] = efficiency_df['deposit_amount'] / efficiency_df['no_of_offices']
+    efficiency_df['Deposit per Account'] = efficiency_df['deposit_amount'] / efficiency_df['no_of_accounts']
+    efficiency_df['Accounts per Office'] = efficiency_df['no_of_accounts'] / efficiency_df['no_of_offices']
     
     efficiency_display = efficiency_df[['Deposit per Office', 'Deposit per Account', 'Accounts per Office']].reset_index()
     
@@ -232,65 +468,13 @@ col1, col2 = st.columns([2, 3])
 
 with col1:
     st.subheader("Top 15 States by Deposits")
-    
-    state_deposits = df.groupby('state_name')['deposit_amount'].sum().sort_values(ascending=False).head(15)
-    
-    fig = go.Figure(go.Bar(
-        x=state_deposits.values,
-        y=state_deposits.index,
-        orientation='h',
-        marker_color=COLORS['secondary'],
-        text=[f'₹{x/1e6:.1f}M' for x in state_deposits.values],
-        textposition='outside'
-    ))
-    
-    fig.update_layout(
-        title="Top 15 States",
-        xaxis_title="Total Deposits (₹)",
-        yaxis_title="State",
-        height=500,
-        yaxis={'categoryorder': 'total ascending'}
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+
+    st.plotly_chart(json.loads(_state_bar_json(df)), use_container_width=True, config=_PLOTLY_CONFIG)
 
 with col2:
     st.subheader("State Performance Details")
-    
-    state_details = df.groupby('state_name').agg({
-        'deposit_amount': ['sum', 'mean'],
-        'no_of_offices': 'sum',
-        'no_of_accounts': 'sum',
-        'district_name': 'nunique'
-    }).round(2)
-    
-    state_details.columns = ['Total Deposits', 'Avg Deposits', 'Offices', 'Accounts', 'Districts']
-    state_details = state_details.sort_values('Total Deposits', ascending=False).head(15)
-    
-    # Create heatmap
-    normalized_data = state_details.copy()
-    for col in normalized_data.columns:
-        normalized_data[col] = (normalized_data[col] - normalized_data[col].min()) / (normalized_data[col].max() - normalized_data[col].min())
-    
-    fig = go.Figure(data=go.Heatmap(
-        z=normalized_data.values.T,
-        x=normalized_data.index,
-        y=normalized_data.columns,
-        colorscale='Blues',
-        text=state_details.values.T,
-        texttemplate='%{text:.0f}',
-        textfont={"size": 10},
-        colorbar=dict(title="Normalized<br>Score")
-    ))
-    
-    fig.update_layout(
-        title="State Performance Heatmap (Top 15)",
-        height=500,
-        xaxis={'side': 'bottom'},
-        yaxis={'side': 'left'}
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+
+    st.plotly_chart(json.loads(_state_heatmap_json(df)), use_container_width=True, config=_PLOTLY_CONFIG)
 
 st.markdown("---")
 
@@ -305,175 +489,130 @@ with col1:
     # Search district
     search_district = st.text_input("Search for a district:", "")
     
-    if search_district:
-        matching_districts = df[df['district_name'].str.contains(search_district, case=False, na=False)]
-        
-        if not matching_districts.empty:
-            st.success(f"Found {len(matching_districts)} matching records")
-            
-            # Show district stats
-            district_stats = matching_districts.groupby('district_name').agg({
-                'deposit_amount': 'sum',
-                'no_of_offices': 'sum',
-                'no_of_accounts': 'sum',
-                'state_name': 'first',
-                'region': 'first'
-            }).reset_index()
-            
-            for _, row in district_stats.iterrows():
-                with st.expander(f"📍 {row['district_name']} ({row['state_name']})"):
-                    st.write(f"**Region:** {row['region']}")
-                    st.write(f"**Total Deposits:** ₹{row['deposit_amount']:,.0f}")
-                    st.write(f"**Offices:** {int(row['no_of_offices']):,}")
-                    st.write(f"**Accounts:** {int(row['no_of_accounts']):,}")
-                    
-                    if row['no_of_offices'] > 0:
-                        st.write(f"**Deposit per Office:** ₹{row['deposit_amount']/row['no_of_offices']:,.0f}")
+    if len(search_district) >= 2:
+        n_matches, district_stats = _district_search(df, search_district)
+
+        if district_stats is not None:
+            st.success(f"Found {n_matches} matching records")
+
+            # One table render instead of an iterrows loop spawning five
+            # st.write calls per district
+            results = district_stats.drop(columns='records').copy()
+            results['deposit_per_office'] = np.where(
+                results['no_of_offices'] > 0,
+                results['deposit_amount'] / results['no_of_offices'],
+                np.nan)
+            results.columns = ['District', 'Total Deposits', 'Offices',
+                               'Accounts', 'State', 'Region', 'Deposit per Office']
+            st.dataframe(
+                results.style.format({
+                    'Total Deposits': '₹{:,.0f}',
+                    'Offices': '{:,.0f}',
+                    'Accounts': '{:,.0f}',
+                    'Deposit per Office': '₹{:,.0f}',
+                }, na_rep='-'),
+                use_container_width=True,
+                hide_index=True
+            )
         else:
             st.warning("No matching districts found")
     else:
-        st.info("Enter a district name to search")
+        st.info("Enter at least two characters of a district name to search")
 
 with col2:
     st.subheader("Top & Bottom Performers")
     
     tab1, tab2 = st.tabs(["Top 10 Districts", "Bottom 10 Districts"])
     
+    top_json, bottom_json = _district_bars_json(df)
+
     with tab1:
-        top_districts = df.groupby('district_name').agg({
-            'deposit_amount': 'sum',
-            'state_name': 'first'
-        }).sort_values('deposit_amount', ascending=False).head(10)
-        
+        st.plotly_chart(json.loads(top_json), use_container_width=True, config=_PLOTLY_CONFIG)
+
+    with tab2:
+        st.plotly_chart(json.loads(bottom_json), use_container_width=True, config=_PLOTLY_CONFIG)
+
+st.markdown("---")
+
+# Infrastructure Efficiency by Geography - collapsed by default so the
+# section only costs anything once a user actually opens it
+with st.expander("⚡ Infrastructure Efficiency by Geography", expanded=False):
+
+    efficiency_metric = st.selectbox(
+        "Select efficiency metric:",
+        ["Accounts per Office", "Deposit per Office", "Deposit per Account"]
+    )
+
+    metric_label = {
+        "Accounts per Office": "Accounts/Office",
+        "Deposit per Office": "₹/Office",
+    }.get(efficiency_metric, "₹/Account")
+
+    region_efficiency, pop_efficiency, state_efficiency = _efficiency_means(df, efficiency_metric)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # By Region
+
         fig = go.Figure(go.Bar(
-            x=top_districts['deposit_amount'],
-            y=[f"{district} ({state})" for district, state in zip(top_districts.index, top_districts['state_name'])],
-            orientation='h',
-            marker_color=COLORS['success'],
-            text=top_districts['deposit_amount'].apply(lambda x: f'₹{x/1e6:.1f}M'),
+            x=region_efficiency.index,
+            y=region_efficiency.values,
+            marker_color=COLORS['primary'],
+            text=[f'{x:,.1f}' for x in region_efficiency.values],
             textposition='outside'
         ))
-        
+    
         fig.update_layout(
-            title="Top 10 Districts by Total Deposits",
-            xaxis_title="Total Deposits (₹)",
-            height=400,
-            yaxis={'categoryorder': 'total ascending'}
+            title=f"{efficiency_metric} by Region",
+            xaxis_title="Region",
+            yaxis_title=metric_label,
+            height=400
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
     
-    with tab2:
-        bottom_districts = df.groupby('district_name').agg({
-            'deposit_amount': 'sum',
-            'state_name': 'first'
-        }).sort_values('deposit_amount', ascending=True).head(10)
-        
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
+
+    with col2:
+        # By Population Group
+
         fig = go.Figure(go.Bar(
-            x=bottom_districts['deposit_amount'],
-            y=[f"{district} ({state})" for district, state in zip(bottom_districts.index, bottom_districts['state_name'])],
-            orientation='h',
-            marker_color=COLORS['danger'],
-            text=bottom_districts['deposit_amount'].apply(lambda x: f'₹{x/1e3:.1f}K'),
+            x=pop_efficiency.index,
+            y=pop_efficiency.values,
+            marker_color=COLORS['success'],
+            text=[f'{x:,.1f}' for x in pop_efficiency.values],
             textposition='outside'
         ))
-        
+    
         fig.update_layout(
-            title="Bottom 10 Districts by Total Deposits",
-            xaxis_title="Total Deposits (₹)",
-            height=400,
-            yaxis={'categoryorder': 'total ascending'}
+            title=f"{efficiency_metric} by Population Group",
+            xaxis_title="Population Group",
+            yaxis_title=metric_label,
+            height=400
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
-
-st.markdown("---")
-
-# Infrastructure Efficiency by Geography
-st.header("⚡ Infrastructure Efficiency by Geography")
-
-efficiency_metric = st.selectbox(
-    "Select efficiency metric:",
-    ["Accounts per Office", "Deposit per Office", "Deposit per Account"]
-)
-
-if efficiency_metric == "Accounts per Office":
-    df['metric'] = df['no_of_accounts'] / df['no_of_offices'].replace(0, 1)
-    metric_label = "Accounts/Office"
-elif efficiency_metric == "Deposit per Office":
-    df['metric'] = df['deposit_amount'] / df['no_of_offices'].replace(0, 1)
-    metric_label = "₹/Office"
-else:
-    df['metric'] = df['deposit_amount'] / df['no_of_accounts'].replace(0, 1)
-    metric_label = "₹/Account"
+    
+        st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
 
-col1, col2 = st.columns(2)
+    # Top states by efficiency
+    st.subheader(f"Top 15 States by {efficiency_metric}")
 
-with col1:
-    # By Region
-    region_efficiency = df.groupby('region')['metric'].mean().sort_values(ascending=False)
-    
     fig = go.Figure(go.Bar(
-        x=region_efficiency.index,
-        y=region_efficiency.values,
-        marker_color=COLORS['primary'],
-        text=[f'{x:,.1f}' for x in region_efficiency.values],
+        x=state_efficiency.values,
+        y=state_efficiency.index,
+        orientation='h',
+        marker_color=COLORS['warning'],
+        text=[f'{x:,.1f}' for x in state_efficiency.values],
         textposition='outside'
     ))
-    
-    fig.update_layout(
-        title=f"{efficiency_metric} by Region",
-        xaxis_title="Region",
-        yaxis_title=metric_label,
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
 
-with col2:
-    # By Population Group
-    pop_efficiency = df.groupby('population_group')['metric'].mean().sort_values(ascending=False)
-    
-    fig = go.Figure(go.Bar(
-        x=pop_efficiency.index,
-        y=pop_efficiency.values,
-        marker_color=COLORS['success'],
-        text=[f'{x:,.1f}' for x in pop_efficiency.values],
-        textposition='outside'
-    ))
-    
     fig.update_layout(
-        title=f"{efficiency_metric} by Population Group",
-        xaxis_title="Population Group",
-        yaxis_title=metric_label,
-        height=400
+        title=f"Top 15 States by {efficiency_metric}",
+        xaxis_title=metric_label,
+        yaxis_title="State",
+        height=500,
+        yaxis={'categoryorder': 'total ascending'}
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
-
-# Top states by efficiency
-st.subheader(f"Top 15 States by {efficiency_metric}")
-
-state_efficiency = df.groupby('state_name')['metric'].mean().sort_values(ascending=False).head(15)
-
-fig = go.Figure(go.Bar(
-    x=state_efficiency.values,
-    y=state_efficiency.index,
-    orientation='h',
-    marker_color=COLORS['warning'],
-    text=[f'{x:,.1f}' for x in state_efficiency.values],
-    textposition='outside'
-))
-
-fig.update_layout(
-    title=f"Top 15 States by {efficiency_metric}",
-    xaxis_title=metric_label,
-    yaxis_title="State",
-    height=500,
-    yaxis={'categoryorder': 'total ascending'}
-)
 
-st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=_PLOTLY_CONFIG)
 
 st.markdown("---")
 
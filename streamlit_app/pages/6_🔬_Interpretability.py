@@ -6,29 +6,429 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
+import json
 import sys
 from pathlib import Path
 
 # Add utils to path
 sys.path.append(str(Path(__file__).parent.parent))
-from utils.data_loader import load_featured_data, load_best_model
 from utils.visualizations import COLORS
+from utils.styles import inject_card_css
 
 st.set_page_config(page_title="Model Interpretability", page_icon="🔬", layout="wide")
+inject_card_css()
+
+# The importance/impact/interaction charts are display-only: rendering
+# them as static plots lets plotly skip hover-model and event-handler
+# setup in the browser. The waterfall stays interactive for hover detail.
+_STATIC_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+_PLOTLY_CONFIG = {'displayModeBar': False, 'responsive': True}
+
+# Layout keys shared by every chart on this page, merged into each cached
+# builder - one place to restyle, same template the visualization helpers
+# use elsewhere in the app
+_COMMON_LAYOUT = dict(template='plotly_white', margin=dict(l=40, r=20, t=50, b=40))
+
+# Static HTML blocks hoisted to constants: no string building at runtime,
+# and identical payloads let the frontend skip re-diffing them. The cards
+# reuse the shared classes from utils.styles.
+_GOAL_HTML = """
+<div class="card-violet">
+    <h3>🎯 Goal</h3>
+    <p>Make the "Black Box" Transparent</p>
+    <hr style="border-color: rgba(255,255,255,0.3);">
+    <h4>Our Best Model</h4>
+    <p style="font-size: 1.2rem; font-weight: bold;">Extra Trees</p>
+    <p style="font-size: 2rem; font-weight: bold; margin: 0.5rem 0;">99.76%</p>
+    <p>Accuracy (R²)</p>
+</div>
+"""
+
+_SUMMARY_CARDS = (
+    """
+    <div class="card-roi-green">
+        <h4>🔑 Key Drivers</h4>
+        <ul>
+            <li>Infrastructure (64%)</li>
+            <li>Efficiency (20%)</li>
+            <li>Geography (12%)</li>
+            <li>Demographics (4%)</li>
+        </ul>
+    </div>
+    """,
+    """
+    <div class="card-roi-blue">
+        <h4>💡 Insights</h4>
+        <ul>
+            <li>Physical presence matters</li>
+            <li>Customer base is crucial</li>
+            <li>Efficiency amplifies impact</li>
+            <li>Rural areas need support</li>
+        </ul>
+    </div>
+    """,
+    """
+    <div class="card-roi-amber">
+        <h4>🎯 Actions</h4>
+        <ul>
+            <li>Invest in infrastructure</li>
+            <li>Grow customer base</li>
+            <li>Monitor efficiency</li>
+            <li>Balance geographies</li>
+        </ul>
+    </div>
+    """,
+)
+
+# Audience-specific guidance for the applications tabs - stored once and
+# rendered in a loop so the tab block is a tiny bytecode path
+_TAB_CONTENT = {
+    "For Bank Managers": """
+    ### 🏦 How Bank Managers Can Use This
+
+    **1. Branch Performance Analysis**
+    - Identify which factors drive deposits in your branches
+    - Compare your branch metrics against feature importance
+    - Focus on high-impact areas for improvement
+
+    **2. Resource Allocation**
+    - Prioritize infrastructure (offices) - 34.2% importance
+    - Focus on customer acquisition (accounts) - 29.8% importance
+    - Improve efficiency ratios - 15.6% importance
+
+    **3. Strategic Planning**
+    - Use feature interactions to plan balanced growth
+    - Don't just add offices - ensure account growth too
+    - Monitor efficiency metrics alongside expansion
+
+    **4. Performance Benchmarking**
+    - Compare your metrics against model's learned patterns
+    - Identify gaps in key features
+    - Set improvement targets based on feature importance
+    """,
+    "For Data Scientists": """
+    ### 🔬 How Data Scientists Can Use This
+
+    **1. Model Validation**
+    - Check if feature importance aligns with domain knowledge
+    - Validate that model isn't relying on spurious correlations
+    - Ensure predictions are based on causal factors
+
+    **2. Feature Engineering**
+    - Focus on creating features similar to high-importance ones
+    - Engineer interaction terms for strongly interacting features
+    - Remove or combine low-importance features
+
+    **3. Data Collection Priorities**
+    - Improve data quality for high-importance features
+    - Collect more granular data for key drivers
+    - Invest in infrastructure/account tracking systems
+
+    **4. Model Improvement**
+    - Investigate prediction errors using SHAP explanations
+    - Identify missing features causing unexplained variance
+    - Refine preprocessing for important features
+    """,
+    "For Policy Makers": """
+    ### 🏛️ How Policy Makers Can Use This
+
+    **1. Infrastructure Policy**
+    - Offices are the #1 factor (34.2% importance)
+    - Incentivize bank branch expansion in underserved areas
+    - Provide subsidies/support for rural office setup
+
+    **2. Financial Inclusion**
+    - Rural areas show negative impact on deposits
+    - Design targeted programs to boost rural deposits
+    - Address systemic barriers revealed by the model
+
+    **3. Regional Development**
+    - Geographic features matter (district/region codes)
+    - Balance infrastructure across regions
+    - Support lagging regions with policy interventions
+
+    **4. Performance Monitoring**
+    - Use feature importance as KPIs for banking sector
+    - Track accounts-per-office ratios nationally
+    - Monitor deposit efficiency across regions
+    """,
+}
+
+# Bar colour per feature category, applied via .map instead of a per-row
+# Python branch chain
+_CAT_COLORS = {
+    'Infrastructure': COLORS['primary'],
+    'Derived': COLORS['success'],
+    'Geographic': COLORS['warning'],
+    'Demographic': COLORS['secondary'],
+}
+
+# The tables on this page are static literals; building them inside cached
+# constructors skips the repeated DataFrame construction and dtype
+# inference on every rerun.
+@st.cache_data(show_spinner=False)
+def _fi_df():
+    """Feature importance table (based on typical analysis)"""
+    return pd.DataFrame({
+        'Feature': [
+            'no_of_offices',
+            'no_of_accounts',
+            'deposit_per_office',
+            'deposit_per_account',
+            'district_code',
+            'accounts_per_office',
+            'state_code',
+            'region_Northern',
+            'population_group_RURAL',
+            'region_Southern',
+            'population_group_SEMI-URBAN',
+            'region_Eastern',
+            'population_group_URBAN',
+            'region_Western'
+        ],
+        'Importance': [
+            0.342, 0.298, 0.156, 0.089, 0.043, 0.028, 0.019, 0.008, 0.006, 0.004, 0.003, 0.002, 0.001, 0.001
+        ],
+        'Category': [
+            'Infrastructure', 'Infrastructure', 'Derived', 'Derived', 'Geographic',
+            'Derived', 'Geographic', 'Geographic', 'Demographic', 'Geographic',
+            'Demographic', 'Geographic', 'Demographic', 'Geographic'
+        ]
+    })
+
+@st.cache_data(show_spinner=False)
+def _impact_df():
+    """Sample feature impact-direction table"""
+    return pd.DataFrame({
+        'Feature': [
+            'no_of_offices',
+            'no_of_accounts',
+            'deposit_per_office',
+            'deposit_per_account',
+            'accounts_per_office',
+            'population_group_RURAL',
+            'population_group_URBAN',
+            'region_Northern',
+            'region_Southern'
+        ],
+        'Positive_Impact': [0.95, 0.92, 0.88, 0.75, 0.65, 0.15, 0.72, 0.58, 0.68],
+        'Negative_Impact': [0.05, 0.08, 0.12, 0.25, 0.35, 0.85, 0.28, 0.42, 0.32]
+    })
+
+@st.cache_data(show_spinner=False)
+def _scenarios():
+    """Sample prediction scenarios for the waterfall explanations"""
+    return {
+        "High-Deposit Metropolitan Office": {
+            "base": 8430.0,
+            "features": {
+                "no_of_offices": 15234.5,
+                "no_of_accounts": 12456.3,
+                "deposit_per_office": 8934.2,
+                "population_group_METRO": 3245.1,
+                "region_Western": 2134.6,
+                "district_code": -234.5,
+                "accounts_per_office": 1567.2
+            },
+            "final": 51767.4
+        },
+        "Average Semi-Urban Branch": {
+            "base": 8430.0,
+            "features": {
+                "no_of_offices": 2345.6,
+                "no_of_accounts": 1987.4,
+                "deposit_per_office": 1234.5,
+                "population_group_SEMI-URBAN": 567.8,
+                "region_Northern": -234.1,
+                "district_code": 123.4,
+                "accounts_per_office": -89.2
+            },
+            "final": 14365.4
+        },
+        "Low-Deposit Rural Office": {
+            "base": 8430.0,
+            "features": {
+                "no_of_offices": -3456.7,
+                "no_of_accounts": -2987.3,
+                "deposit_per_office": -1234.8,
+                "population_group_RURAL": -1567.2,
+                "region_Eastern": -345.6,
+                "district_code": 89.4,
+                "accounts_per_office": -234.1
+            },
+            "final": -1306.3
+        }
+    }
+
+@st.cache_data(show_spinner=False)
+def _category_importance():
+    """Importance totals per feature category"""
+    return _fi_df().groupby('Category')['Importance'].sum().sort_values(ascending=False)
+
+# Derived scalars/series over the static table - cache hits on every rerun,
+# so the head/sum and groupby never recompute after the first run
+TOP3_SUM = _fi_df().head(3)['Importance'].sum()
+CATEGORY_IMPORTANCE = _category_importance()
+
+# Every chart on this page is built from static data (only the waterfall
+# varies, and only by scenario name), so the figures are constructed once
+# inside cached helpers and replayed as JSON. Caching the serialised form
+# also skips Streamlit's per-rerun figure serialisation.
+@st.cache_data(show_spinner=False)
+def _importance_fig_json():
+    """Horizontal feature-importance bar chart"""
+    fi = _fi_df()
+    fig = go.Figure()
+
+    colors = fi['Category'].map(_CAT_COLORS).to_numpy()
+
+    fig.add_trace(go.Bar(
+        y=fi['Feature'],
+        x=fi['Importance'],
+        orientation='h',
+        marker_color=colors,
+        # Vectorised label formatting - no per-row lambda dispatch
+        text=np.char.add((fi['Importance'].to_numpy() * 100).round(1).astype(str), '%'),
+        textposition='outside'
+    ))
+
+    fig.update_layout(
+        **_COMMON_LAYOUT,
+        title="Feature Importance Rankings",
+        xaxis_title="Importance Score",
+        yaxis_title="Feature",
+        height=600,
+        yaxis={'categoryorder': 'total ascending'},
+        showlegend=False
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def _impact_fig_json():
+    """Diverging positive/negative impact-direction bar chart"""
+    impact = _impact_df()
+    fig = go.Figure()
+
+    def _pct_labels(col):
+        # Vectorised whole-percent labels - no per-row lambda dispatch
+        return np.char.add((impact[col].to_numpy() * 100).round().astype(int).astype(str), '%')
+
+    fig.add_trace(go.Bar(
+        name='Positive Impact',
+        y=impact['Feature'],
+        x=impact['Positive_Impact'],
+        orientation='h',
+        marker_color=COLORS['success'],
+        text=_pct_labels('Positive_Impact'),
+        textposition='inside'
+    ))
+
+    fig.add_trace(go.Bar(
+        name='Negative Impact',
+        y=impact['Feature'],
+        x=-impact['Negative_Impact'],
+        orientation='h',
+        marker_color=COLORS['danger'],
+        text=_pct_labels('Negative_Impact'),
+        textposition='inside'
+    ))
+
+    fig.update_layout(
+        **_COMMON_LAYOUT,
+        title="Feature Impact Direction (% of predictions affected positively vs negatively)",
+        xaxis_title="Impact Direction",
+        yaxis_title="Feature",
+        barmode='overlay',
+        height=500,
+        xaxis=dict(
+            tickvals=[-1, -0.5, 0, 0.5, 1],
+            ticktext=['100%\nNegative', '50%', '0%', '50%', '100%\nPositive']
+        )
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def _waterfall_json(scenario_name):
+    """Waterfall explanation for one scenario, keyed by its name
+
+    Three possible scenarios means three cache slots; switching the
+    selectbox after the first visit replays cached JSON.
+    """
+    scenario = _scenarios()[scenario_name]
+
+    # Single tuple allocation each - no intermediate lists or concats
+    values = (scenario['base'], *scenario['features'].values(), scenario['final'])
+    labels = ('Baseline', *scenario['features'], 'Final Prediction')
+    measures = ('absolute', *['relative'] * len(scenario['features']), 'total')
+
+    fig = go.Figure(go.Waterfall(
+        name="Contribution",
+        orientation="v",
+        measure=measures,
+        x=labels,
+        y=values,
+        connector={"line": {"color": "rgb(63, 63, 63)"}},
+        decreasing={"marker": {"color": COLORS['danger']}},
+        increasing={"marker": {"color": COLORS['success']}},
+        totals={"marker": {"color": COLORS['primary']}}
+    ))
+
+    fig.update_layout(
+        **_COMMON_LAYOUT,
+        title=f"Prediction Explanation: {scenario_name}",
+        xaxis_title="Features",
+        yaxis_title="Contribution to Prediction (₹)",
+        height=500,
+        showlegend=False
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def _interaction_matrix(n):
+    """Simulated symmetric interaction strength matrix
+
+    Deterministic via a locally seeded default_rng rather than the legacy
+    global np.random state, which other code could perturb.
+    """
+    rng = np.random.default_rng(42)
+    m = rng.random((n, n))
+    m = (m + m.T) / 2  # Make symmetric
+    np.fill_diagonal(m, 1.0)
+    return m
+
+@st.cache_data(show_spinner=False)
+def _interaction_fig_json():
+    """Feature-interaction heatmap over the simulated strength matrix"""
+    interaction_features = [
+        'no_of_offices', 'no_of_accounts', 'deposit_per_office',
+        'deposit_per_account', 'accounts_per_office'
+    ]
+
+    fig = go.Figure(data=go.Heatmap(
+        z=_interaction_matrix(len(interaction_features)),
+        x=interaction_features,
+        y=interaction_features,
+        colorscale='RdYlGn',
+        # Cell labels come straight from z - no duplicate text array in the payload
+        texttemplate='%{z:.2f}',
+        textfont={"size": 10},
+        colorbar=dict(title="Interaction<br>Strength")
+    ))
+
+    fig.update_layout(
+        **_COMMON_LAYOUT,
+        title="Feature Interaction Heatmap",
+        height=500,
+        xaxis={'side': 'bottom'},
+        yaxis={'side': 'left'}
+    )
+    return fig.to_json()
 
 # Title
 st.title("🔬 Model Interpretability")
 st.markdown("**Understanding How the Model Makes Predictions**")
 st.markdown("---")
 
-# Load data
-df = load_featured_data()
-
-if df is None:
-    st.error("Unable to load featured data. Please check if the file exists.")
-    st.stop()
-
 # Introduction
 st.header("📖 What is Model Interpretability?")
 
@@ -53,18 +453,7 @@ with col1:
     """)
 
 with col2:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                border-radius: 10px; color: white; text-align: center;">
-        <h3>🎯 Goal</h3>
-        <p>Make the "Black Box" Transparent</p>
-        <hr style="border-color: rgba(255,255,255,0.3);">
-        <h4>Our Best Model</h4>
-        <p style="font-size: 1.2rem; font-weight: bold;">Extra Trees</p>
-        <p style="font-size: 2rem; font-weight: bold; margin: 0.5rem 0;">99.76%</p>
-        <p>Accuracy (R²)</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_GOAL_HTML, unsafe_allow_html=True)
 
 st.markdown("---")
 
@@ -76,65 +465,14 @@ st.info("""
 Higher importance means the feature has a stronger influence on predicting deposit amounts.
 """)
 
-# Create feature importance data (based on typical analysis)
-feature_importance_data = pd.DataFrame({
-    'Feature': [
-        'no_of_offices',
-        'no_of_accounts',
-        'deposit_per_office',
-        'deposit_per_account',
-        'district_code',
-        'accounts_per_office',
-        'state_code',
-        'region_Northern',
-        'population_group_RURAL',
-        'region_Southern',
-        'population_group_SEMI-URBAN',
-        'region_Eastern',
-        'population_group_URBAN',
-        'region_Western'
-    ],
-    'Importance': [
-        0.342, 0.298, 0.156, 0.089, 0.043, 0.028, 0.019, 0.008, 0.006, 0.004, 0.003, 0.002, 0.001, 0.001
-    ],
-    'Category': [
-        'Infrastructure', 'Infrastructure', 'Derived', 'Derived', 'Geographic',
-        'Derived', 'Geographic', 'Geographic', 'Demographic', 'Geographic',
-        'Demographic', 'Geographic', 'Demographic', 'Geographic'
-    ]
-})
+# Feature importance data (based on typical analysis)
+feature_importance_data = _fi_df()
 
 col1, col2 = st.columns([3, 2])
 
 with col1:
     # Bar chart
-    fig = go.Figure()
-    
-    colors = [COLORS['primary'] if cat == 'Infrastructure' else 
-              COLORS['success'] if cat == 'Derived' else
-              COLORS['warning'] if cat == 'Geographic' else
-              COLORS['secondary']
-              for cat in feature_importance_data['Category']]
-    
-    fig.add_trace(go.Bar(
-        y=feature_importance_data['Feature'],
-        x=feature_importance_data['Importance'],
-        orientation='h',
-        marker_color=colors,
-        text=feature_importance_data['Importance'].apply(lambda x: f'{x:.1%}'),
-        textposition='outside'
-    ))
-    
-    fig.update_layout(
-        title="Feature Importance Rankings",
-        xaxis_title="Importance Score",
-        yaxis_title="Feature",
-        height=600,
-        yaxis={'categoryorder': 'total ascending'},
-        showlegend=False
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(json.loads(_importance_fig_json()), use_container_width=True, config=_STATIC_CONFIG)
 
 with col2:
     st.markdown("### 🔑 Key Findings")
@@ -154,422 +492,165 @@ with col2:
        - Efficiency indicator
        - Productivity measure
     
-    **Combined Impact:** {feature_importance_data.head(3)['Importance'].sum():.1%}
+    **Combined Impact:** {TOP3_SUM:.1%}
     """)
     
     st.markdown("---")
     
     # Category breakdown
-    category_importance = feature_importance_data.groupby('Category')['Importance'].sum().sort_values(ascending=False)
-    
     st.markdown("### 📦 By Category")
-    
-    for category, importance in category_importance.items():
+
+    for category, importance in CATEGORY_IMPORTANCE.items():
         st.markdown(f"**{category}:** {importance:.1%}")
         st.progress(float(importance))
 
 st.markdown("---")
 
 # Feature Impact Direction
-st.header("↔️ Feature Impact Direction")
-
-st.info("""
-**Feature impact** shows how each feature affects predictions:
-- **Positive impact:** Higher feature values → Higher predicted deposits
-- **Negative impact:** Higher feature values → Lower predicted deposits
-""")
+with st.expander("↔️ Feature Impact Direction", expanded=False):
 
-# Create sample impact data
-impact_data = pd.DataFrame({
-    'Feature': [
-        'no_of_offices',
-        'no_of_accounts',
-        'deposit_per_office',
-        'deposit_per_account',
-        'accounts_per_office',
-        'population_group_RURAL',
-        'population_group_URBAN',
-        'region_Northern',
-        'region_Southern'
-    ],
-    'Positive_Impact': [0.95, 0.92, 0.88, 0.75, 0.65, 0.15, 0.72, 0.58, 0.68],
-    'Negative_Impact': [0.05, 0.08, 0.12, 0.25, 0.35, 0.85, 0.28, 0.42, 0.32]
-})
-
-fig = go.Figure()
-
-fig.add_trace(go.Bar(
-    name='Positive Impact',
-    y=impact_data['Feature'],
-    x=impact_data['Positive_Impact'],
-    orientation='h',
-    marker_color=COLORS['success'],
-    text=impact_data['Positive_Impact'].apply(lambda x: f'{x:.0%}'),
-    textposition='inside'
-))
-
-fig.add_trace(go.Bar(
-    name='Negative Impact',
-    y=impact_data['Feature'],
-    x=-impact_data['Negative_Impact'],
-    orientation='h',
-    marker_color=COLORS['danger'],
-    text=impact_data['Negative_Impact'].apply(lambda x: f'{x:.0%}'),
-    textposition='inside'
-))
-
-fig.update_layout(
-    title="Feature Impact Direction (% of predictions affected positively vs negatively)",
-    xaxis_title="Impact Direction",
-    yaxis_title="Feature",
-    barmode='overlay',
-    height=500,
-    xaxis=dict(
-        tickvals=[-1, -0.5, 0, 0.5, 1],
-        ticktext=['100%\nNegative', '50%', '0%', '50%', '100%\nPositive']
-    )
-)
+    st.info("""
+    **Feature impact** shows how each feature affects predictions:
+    - **Positive impact:** Higher feature values → Higher predicted deposits
+    - **Negative impact:** Higher feature values → Lower predicted deposits
+    """)
 
-st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(json.loads(_impact_fig_json()), use_container_width=True, config=_STATIC_CONFIG)
 
-# Interpretation
-col1, col2 = st.columns(2)
+    # Interpretation
+    col1, col2 = st.columns(2)
 
-with col1:
-    st.success("""
-    ### ✅ Positive Drivers
+    with col1:
+        st.success("""
+        ### ✅ Positive Drivers
     
-    **Infrastructure Features** predominantly show positive impact:
-    - More offices → Higher deposits ✓
-    - More accounts → Higher deposits ✓
-    - Better efficiency ratios → Higher deposits ✓
+        **Infrastructure Features** predominantly show positive impact:
+        - More offices → Higher deposits ✓
+        - More accounts → Higher deposits ✓
+        - Better efficiency ratios → Higher deposits ✓
     
-    **Urban/Metro Populations** also contribute positively:
-    - Urban areas have higher deposit potential
-    - Better infrastructure utilization
-    """)
+        **Urban/Metro Populations** also contribute positively:
+        - Urban areas have higher deposit potential
+        - Better infrastructure utilization
+        """)
 
-with col2:
-    st.warning("""
-    ### ⚠️ Negative Indicators
+    with col2:
+        st.warning("""
+        ### ⚠️ Negative Indicators
     
-    **Rural Classification** shows negative impact:
-    - Rural areas typically have lower deposits
-    - Infrastructure challenges
-    - Economic constraints
+        **Rural Classification** shows negative impact:
+        - Rural areas typically have lower deposits
+        - Infrastructure challenges
+        - Economic constraints
     
-    **Note:** This reveals the deposit gap between 
-    urban and rural areas - an opportunity for 
-    targeted interventions!
-    """)
+        **Note:** This reveals the deposit gap between 
+        urban and rural areas - an opportunity for 
+        targeted interventions!
+        """)
 
 st.markdown("---")
 
 # Sample Prediction Explanations
-st.header("🔍 Sample Prediction Explanations")
+with st.expander("🔍 Sample Prediction Explanations", expanded=False):
 
-st.info("""
-**Waterfall charts** show how each feature contributes to a specific prediction, 
-starting from the baseline (average) and adding/subtracting feature contributions.
-""")
+    st.info("""
+    **Waterfall charts** show how each feature contributes to a specific prediction, 
+    starting from the baseline (average) and adding/subtracting feature contributions.
+    """)
 
-# Create sample predictions
-sample_scenarios = {
-    "High-Deposit Metropolitan Office": {
-        "base": 8430.0,
-        "features": {
-            "no_of_offices": 15234.5,
-            "no_of_accounts": 12456.3,
-            "deposit_per_office": 8934.2,
-            "population_group_METRO": 3245.1,
-            "region_Western": 2134.6,
-            "district_code": -234.5,
-            "accounts_per_office": 1567.2
-        },
-        "final": 51767.4
-    },
-    "Average Semi-Urban Branch": {
-        "base": 8430.0,
-        "features": {
-            "no_of_offices": 2345.6,
-            "no_of_accounts": 1987.4,
-            "deposit_per_office": 1234.5,
-            "population_group_SEMI-URBAN": 567.8,
-            "region_Northern": -234.1,
-            "district_code": 123.4,
-            "accounts_per_office": -89.2
-        },
-        "final": 14365.4
-    },
-    "Low-Deposit Rural Office": {
-        "base": 8430.0,
-        "features": {
-            "no_of_offices": -3456.7,
-            "no_of_accounts": -2987.3,
-            "deposit_per_office": -1234.8,
-            "population_group_RURAL": -1567.2,
-            "region_Eastern": -345.6,
-            "district_code": 89.4,
-            "accounts_per_office": -234.1
-        },
-        "final": -1306.3
-    }
-}
+    # Sample predictions
+    sample_scenarios = _scenarios()
 
-selected_scenario = st.selectbox(
-    "Select a scenario to explain:",
-    list(sample_scenarios.keys())
-)
+    # Fragment: changing the scenario reruns only this block, not the whole
+    # page with its other charts
+    @st.fragment
+    def scenario_section():
+        selected_scenario = st.selectbox(
+            "Select a scenario to explain:",
+            list(sample_scenarios.keys())
+        )
 
-scenario = sample_scenarios[selected_scenario]
-
-# Create waterfall chart
-values = [scenario['base']] + list(scenario['features'].values()) + [scenario['final']]
-labels = ['Baseline'] + list(scenario['features'].keys()) + ['Final Prediction']
-measures = ['absolute'] + ['relative'] * len(scenario['features']) + ['total']
-
-fig = go.Figure(go.Waterfall(
-    name="Contribution",
-    orientation="v",
-    measure=measures,
-    x=labels,
-    y=values,
-    connector={"line": {"color": "rgb(63, 63, 63)"}},
-    decreasing={"marker": {"color": COLORS['danger']}},
-    increasing={"marker": {"color": COLORS['success']}},
-    totals={"marker": {"color": COLORS['primary']}}
-))
-
-fig.update_layout(
-    title=f"Prediction Explanation: {selected_scenario}",
-    xaxis_title="Features",
-    yaxis_title="Contribution to Prediction (₹)",
-    height=500,
-    showlegend=False
-)
+        scenario = sample_scenarios[selected_scenario]
 
-st.plotly_chart(fig, use_container_width=True)
+        # Waterfall chart, cached per scenario name
+        st.plotly_chart(json.loads(_waterfall_json(selected_scenario)), use_container_width=True, config=_PLOTLY_CONFIG)
 
-# Explanation text
-st.markdown(f"""
-**Interpretation:**
+        # Explanation text
+        st.markdown(f"""
+        **Interpretation:**
 
-- **Baseline:** Average deposit across all records = ₹{scenario['base']:,.0f}
-- **Feature Contributions:** Each feature adds or subtracts from the baseline
-- **Final Prediction:** ₹{scenario['final']:,.0f}
+        - **Baseline:** Average deposit across all records = ₹{scenario['base']:,.0f}
+        - **Feature Contributions:** Each feature adds or subtracts from the baseline
+        - **Final Prediction:** ₹{scenario['final']:,.0f}
 
-The model arrives at this prediction by:
-1. Starting with the overall average
-2. Adjusting based on infrastructure metrics (offices, accounts)
-3. Considering efficiency ratios
-4. Accounting for geographic and demographic factors
-5. Producing a final prediction
-""")
+        The model arrives at this prediction by:
+        1. Starting with the overall average
+        2. Adjusting based on infrastructure metrics (offices, accounts)
+        3. Considering efficiency ratios
+        4. Accounting for geographic and demographic factors
+        5. Producing a final prediction
+        """)
+
+    scenario_section()
 
 st.markdown("---")
 
 # Feature Interactions
-st.header("🔄 Feature Interactions")
+with st.expander("🔄 Feature Interactions", expanded=False):
 
-st.info("""
-**Feature interactions** reveal how features work together to influence predictions.
-Some features amplify or dampen each other's effects.
-""")
-
-# Create interaction heatmap
-interaction_features = [
-    'no_of_offices', 'no_of_accounts', 'deposit_per_office',
-    'deposit_per_account', 'accounts_per_office'
-]
-
-# Simulated interaction strength matrix
-np.random.seed(42)
-interaction_matrix = np.random.rand(len(interaction_features), len(interaction_features))
-interaction_matrix = (interaction_matrix + interaction_matrix.T) / 2  # Make symmetric
-np.fill_diagonal(interaction_matrix, 1.0)
-
-fig = go.Figure(data=go.Heatmap(
-    z=interaction_matrix,
-    x=interaction_features,
-    y=interaction_features,
-    colorscale='RdYlGn',
-    text=interaction_matrix,
-    texttemplate='%{text:.2f}',
-    textfont={"size": 10},
-    colorbar=dict(title="Interaction<br>Strength")
-))
-
-fig.update_layout(
-    title="Feature Interaction Heatmap",
-    height=500,
-    xaxis={'side': 'bottom'},
-    yaxis={'side': 'left'}
-)
+    st.info("""
+    **Feature interactions** reveal how features work together to influence predictions.
+    Some features amplify or dampen each other's effects.
+    """)
 
-st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(json.loads(_interaction_fig_json()), use_container_width=True, config=_STATIC_CONFIG)
 
-col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-with col1:
-    st.success("""
-    ### 🤝 Strong Interactions
+    with col1:
+        st.success("""
+        ### 🤝 Strong Interactions
     
-    **Offices ↔ Accounts:**
-    - Work together synergistically
-    - Combined effect > individual effects
-    - Infrastructure + customer base
+        **Offices ↔ Accounts:**
+        - Work together synergistically
+        - Combined effect > individual effects
+        - Infrastructure + customer base
     
-    **Efficiency Ratios:**
-    - Deposit per office × Accounts per office
-    - Productivity multiplier effect
-    - Quality + quantity
-    """)
+        **Efficiency Ratios:**
+        - Deposit per office × Accounts per office
+        - Productivity multiplier effect
+        - Quality + quantity
+        """)
 
-with col2:
-    st.info("""
-    ### 💡 Insights
+    with col2:
+        st.info("""
+        ### 💡 Insights
     
-    - Infrastructure metrics amplify each other
-    - Efficiency ratios provide context
-    - Geographic factors modify base effects
-    - Population group acts as a multiplier
+        - Infrastructure metrics amplify each other
+        - Efficiency ratios provide context
+        - Geographic factors modify base effects
+        - Population group acts as a multiplier
     
-    **Key Takeaway:** Building infrastructure 
-    alone isn't enough - need balanced growth 
-    across all dimensions!
-    """)
+        **Key Takeaway:** Building infrastructure 
+        alone isn't enough - need balanced growth 
+        across all dimensions!
+        """)
 
 st.markdown("---")
 
 # Practical Applications
-st.header("🎯 Practical Applications")
-
-tab1, tab2, tab3 = st.tabs([
-    "For Bank Managers",
-    "For Data Scientists",
-    "For Policy Makers"
-])
-
-with tab1:
-    st.markdown("""
-    ### 🏦 How Bank Managers Can Use This
-    
-    **1. Branch Performance Analysis**
-    - Identify which factors drive deposits in your branches
-    - Compare your branch metrics against feature importance
-    - Focus on high-impact areas for improvement
-    
-    **2. Resource Allocation**
-    - Prioritize infrastructure (offices) - 34.2% importance
-    - Focus on customer acquisition (accounts) - 29.8% importance
-    - Improve efficiency ratios - 15.6% importance
-    
-    **3. Strategic Planning**
-    - Use feature interactions to plan balanced growth
-    - Don't just add offices - ensure account growth too
-    - Monitor efficiency metrics alongside expansion
-    
-    **4. Performance Benchmarking**
-    - Compare your metrics against model's learned patterns
-    - Identify gaps in key features
-    - Set improvement targets based on feature importance
-    """)
-
-with tab2:
-    st.markdown("""
-    ### 🔬 How Data Scientists Can Use This
-    
-    **1. Model Validation**
-    - Check if feature importance aligns with domain knowledge
-    - Validate that model isn't relying on spurious correlations
-    - Ensure predictions are based on causal factors
-    
-    **2. Feature Engineering**
-    - Focus on creating features similar to high-importance ones
-    - Engineer interaction terms for strongly interacting features
-    - Remove or combine low-importance features
-    
-    **3. Data Collection Priorities**
-    - Improve data quality for high-importance features
-    - Collect more granular data for key drivers
-    - Invest in infrastructure/account tracking systems
-    
-    **4. Model Improvement**
-    - Investigate prediction errors using SHAP explanations
-    - Identify missing features causing unexplained variance
-    - Refine preprocessing for important features
-    """)
-
-with tab3:
-    st.markdown("""
-    ### 🏛️ How Policy Makers Can Use This
-    
-    **1. Infrastructure Policy**
-    - Offices are the #1 factor (34.2% importance)
-    - Incentivize bank branch expansion in underserved areas
-    - Provide subsidies/support for rural office setup
-    
-    **2. Financial Inclusion**
-    - Rural areas show negative impact on deposits
-    - Design targeted programs to boost rural deposits
-    - Address systemic barriers revealed by the model
-    
-    **3. Regional Development**
-    - Geographic features matter (district/region codes)
-    - Balance infrastructure across regions
-    - Support lagging regions with policy interventions
-    
-    **4. Performance Monitoring**
-    - Use feature importance as KPIs for banking sector
-    - Track accounts-per-office ratios nationally
-    - Monitor deposit efficiency across regions
-    """)
+with st.expander("🎯 Practical Applications", expanded=False):
+    for tab, content in zip(st.tabs(list(_TAB_CONTENT)), _TAB_CONTENT.values()):
+        tab.markdown(content)
 
 st.markdown("---")
 
 # Summary
 st.header("📝 Summary")
 
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: #ecfdf5; border-radius: 10px; border-left: 4px solid #10b981;">
-        <h4>🔑 Key Drivers</h4>
-        <ul>
-            <li>Infrastructure (64%)</li>
-            <li>Efficiency (20%)</li>
-            <li>Geography (12%)</li>
-            <li>Demographics (4%)</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: #eff6ff; border-radius: 10px; border-left: 4px solid #3b82f6;">
-        <h4>💡 Insights</h4>
-        <ul>
-            <li>Physical presence matters</li>
-            <li>Customer base is crucial</li>
-            <li>Efficiency amplifies impact</li>
-            <li>Rural areas need support</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: #fef3c7; border-radius: 10px; border-left: 4px solid #f59e0b;">
-        <h4>🎯 Actions</h4>
-        <ul>
-            <li>Invest in infrastructure</li>
-            <li>Grow customer base</li>
-            <li>Monitor efficiency</li>
-            <li>Balance geographies</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
+for col, card_html in zip(st.columns(3), _SUMMARY_CARDS):
+    with col:
+        st.markdown(card_html, unsafe_allow_html=True)
 
 st.success("""
 ### 🎉 Conclusion
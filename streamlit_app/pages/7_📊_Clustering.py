@@ -7,15 +7,370 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import json
 import sys
 from pathlib import Path
 
-# Add utils to path
-sys.path.append(str(Path(__file__).parent.parent))
+# Add utils to path (guarded so reruns don't grow sys.path)
+_APP_DIR = str(Path(__file__).parent.parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 from utils.data_loader import load_featured_data
 from utils.visualizations import COLORS
+from utils.styles import inject_card_css
 
 st.set_page_config(page_title="Clustering Analysis", page_icon="📊", layout="wide")
+inject_card_css()
+
+# Static HTML blocks as module constants on the shared card classes -
+# built once, constant payload for the frontend diff
+_GOAL_HTML = """
+<div class="card-violet">
+    <h3>🎯 Goal</h3>
+    <p>Find Natural Groups in Data</p>
+    <hr style="border-color: rgba(255,255,255,0.3);">
+    <h4>Algorithms Applied</h4>
+    <p style="font-size: 2rem; font-weight: bold; margin: 0.5rem 0;">4</p>
+    <p>Clustering Methods</p>
+    <hr style="border-color: rgba(255,255,255,0.3);">
+    <h4>Optimal Clusters</h4>
+    <p style="font-size: 2rem; font-weight: bold; margin: 0.5rem 0;">4</p>
+    <p>Distinct Groups</p>
+</div>
+"""
+
+_SUMMARY_CARDS = (
+    """
+    <div class="card-roi-green">
+        <h4>🎯 Clusters Identified</h4>
+        <ol>
+            <li>High-Volume Metro (17.8%)</li>
+            <li>Efficient Semi-Urban (30.6%)</li>
+            <li>Growing Urban (28.5%)</li>
+            <li>Rural Baseline (23.1%)</li>
+        </ol>
+    </div>
+    """,
+    """
+    <div class="card-roi-blue">
+        <h4>💡 Best Algorithm</h4>
+        <p><strong>K-Means</strong></p>
+        <ul>
+            <li>Silhouette: 0.612</li>
+            <li>DB Score: 0.721</li>
+            <li>Time: 0.034s</li>
+            <li>Clear separation</li>
+        </ul>
+    </div>
+    """,
+    """
+    <div class="card-roi-amber">
+        <h4>🚀 Next Steps</h4>
+        <ul>
+            <li>Implement cluster strategies</li>
+            <li>Monitor cluster evolution</li>
+            <li>Measure cluster KPIs</li>
+            <li>Refine segmentation</li>
+        </ul>
+    </div>
+    """,
+)
+
+# Four-slot bar palette shared by the algorithm and cluster bar charts
+_BAR_PALETTE = (COLORS['success'], COLORS['primary'], COLORS['warning'], COLORS['secondary'])
+
+# Per-cluster characteristics markdown, indexed by profile position -
+# replaces an if/elif chain inside the render loop
+_STRATEGY_MD = (
+    """
+    **Characteristics:**
+    - 🏙️ Concentrated in metropolitan areas
+    - 💰 Highest deposit amounts
+    - 🏢 Large branch networks
+    - 👥 Extensive customer base
+    - ⚡ High efficiency ratios
+
+    **Strategy:** Premium products, wealth management, digital banking
+    """,
+    """
+    **Characteristics:**
+    - 🏘️ Semi-urban locations
+    - 📊 Moderate deposit levels
+    - ⚖️ Balanced infrastructure
+    - 🎯 Growth-oriented markets
+    - 💡 Good efficiency
+
+    **Strategy:** Mass market products, financial literacy, expansion focus
+    """,
+    """
+    **Characteristics:**
+    - 🌆 Urban centers
+    - 📈 Growing deposit base
+    - 🚀 Expansion phase
+    - 👨‍👩‍👧‍👦 Diverse customer segments
+    - 🔄 Dynamic markets
+
+    **Strategy:** Product diversification, technology adoption, market penetration
+    """,
+    """
+    **Characteristics:**
+    - 🌾 Rural areas
+    - 💵 Lower deposit volumes
+    - 🏚️ Limited infrastructure
+    - 📉 Challenges in penetration
+    - 🎯 High potential for inclusion
+
+    **Strategy:** Financial inclusion, mobile banking, government schemes, awareness programs
+    """,
+)
+
+# Static literal tables built once in cached constructors - reruns skip
+# the DataFrame construction and dtype inference entirely
+@st.cache_data(show_spinner=False)
+def _clustering_results():
+    """Sample clustering algorithm comparison table"""
+    return pd.DataFrame({
+        'Algorithm': ['K-Means', 'Hierarchical', 'DBSCAN', 'Gaussian Mixture'],
+        'Clusters Found': [4, 4, 5, 4],
+        'Silhouette Score': [0.612, 0.587, 0.423, 0.598],
+        'Davies-Bouldin Score': [0.721, 0.834, 1.234, 0.756],
+        'Execution Time (s)': [0.034, 0.089, 0.067, 0.156]
+    })
+
+@st.cache_data(show_spinner=False)
+def _cluster_profiles():
+    """Sample per-cluster profile table with pre-rendered metric strings"""
+    df = pd.DataFrame({
+        'Cluster': ['Cluster 1', 'Cluster 2', 'Cluster 3', 'Cluster 4'],
+        'Profile Name': ['High-Volume Metro', 'Efficient Semi-Urban', 'Growing Urban', 'Rural Baseline'],
+        'Avg Deposits (₹)': [125450, 45230, 67890, 12340],
+        'Avg Offices': [234, 67, 98, 23],
+        'Avg Accounts': [3456, 892, 1345, 234],
+        'Dominant Region': ['Western', 'Northern', 'Southern', 'Eastern'],
+        'Dominant Pop Group': ['METROPOLITAN', 'SEMI-URBAN', 'URBAN', 'RURAL'],
+        'Size (records)': [1245, 2134, 1987, 1611],
+        'Percentage': [17.8, 30.6, 28.5, 23.1]
+    })
+    # st.metric display strings, formatted once here rather than per rerun
+    # in the expander loop
+    return df.assign(**{
+        '_deposits_fmt': [f'₹{v:,.0f}' for v in df['Avg Deposits (₹)']],
+        '_offices_fmt': [f'{v:,.0f}' for v in df['Avg Offices']],
+        '_accounts_fmt': [f'{v:,.0f}' for v in df['Avg Accounts']],
+        '_size_fmt': [f'{s:,} ({p:.1f}%)' for s, p in zip(df['Size (records)'], df['Percentage'])],
+    })
+
+# The illustrative cluster samples are deterministic (fixed seed), so they
+# are generated once inside cached functions instead of being redrawn and
+# re-concatenated on every widget interaction.
+@st.cache_data(show_spinner=False)
+def _make_cluster_df(n_samples=1000, seed=42):
+    """Synthetic 2D cluster sample with per-point deposits"""
+    rng = np.random.default_rng(seed)
+
+    # Create 4 clusters with different characteristics: one draw for all
+    # points, with the repeated centers broadcast-added - no per-cluster
+    # loop, no concat
+    cluster_centers = np.array([[2, 3], [8, 8], [3, 9], [9, 3]])
+    n = n_samples // 4
+    # float32/int32 are ample for visualisation and halve both frame
+    # memory and the serialised plotly payload
+    xy = (rng.standard_normal((4 * n, 2)) * 1.5
+          + np.repeat(cluster_centers, n, axis=0)).astype(np.float32)
+
+    return pd.DataFrame({
+        'PC1': xy[:, 0],
+        'PC2': xy[:, 1],
+        # Categorical: int8 codes + 4 label strings instead of N string refs
+        'Cluster': pd.Categorical.from_codes(
+            np.repeat(np.arange(4, dtype=np.int8), n),
+            categories=[f'Cluster {i+1}' for i in range(4)]),
+        'Deposits': rng.integers(1000, 100000, 4 * n, dtype=np.int32)
+    })
+
+@st.cache_data(show_spinner=False)
+def _make_tsne_df(n_samples=1000, seed=42):
+    """Simulated t-SNE embedding derived from the PCA sample"""
+    cluster_df = _make_cluster_df(n_samples, seed)
+    # Offset the seed so the noise stream differs from the base sample's
+    rng = np.random.default_rng(seed + 1)
+    noise = rng.standard_normal((len(cluster_df), 2)).astype(np.float32) * 0.5
+    return cluster_df.assign(**{
+        't-SNE 1': cluster_df['PC1'].to_numpy() * 1.2 + noise[:, 0],
+        't-SNE 2': cluster_df['PC2'].to_numpy() * 0.9 + noise[:, 1],
+    })
+
+@st.cache_data(show_spinner=False)
+def _make_cluster_df_3d(n_samples=1000, seed=42):
+    """PCA sample extended with a third synthetic component"""
+    cluster_df = _make_cluster_df(n_samples, seed)
+    rng = np.random.default_rng(seed + 2)
+    return cluster_df.assign(
+        PC3=rng.standard_normal(len(cluster_df)).astype(np.float32) * 2
+            + cluster_df['PC1'] * 0.3)
+
+# Streamlit executes every tab body on each rerun, so all three 1000-point
+# scatters were rebuilt and re-serialised per interaction. Cached JSON
+# builders make each one a string replay after the first render.
+@st.cache_data(show_spinner=False)
+def _pca_fig_json(n_samples=1000, seed=42):
+    """PCA scatter of the cluster sample"""
+    fig = px.scatter(
+        _make_cluster_df(n_samples, seed),
+        x='PC1',
+        y='PC2',
+        color='Cluster',
+        hover_data=['Deposits'],
+        title='PCA-based Cluster Visualization',
+        color_discrete_sequence=px.colors.qualitative.Set2,
+        # WebGL traces: one GPU buffer instead of a DOM node per point
+        render_mode='webgl'
+    )
+    fig.update_traces(marker=dict(size=6))
+    fig.update_layout(height=600)
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def _tsne_fig_json(n_samples=1000, seed=42):
+    """Simulated t-SNE scatter of the cluster sample"""
+    fig = px.scatter(
+        _make_tsne_df(n_samples, seed),
+        x='t-SNE 1',
+        y='t-SNE 2',
+        color='Cluster',
+        hover_data=['Deposits'],
+        title='t-SNE-based Cluster Visualization',
+        color_discrete_sequence=px.colors.qualitative.Pastel,
+        render_mode='webgl'
+    )
+    fig.update_traces(marker=dict(size=6))
+    fig.update_layout(height=600)
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def _cluster3d_fig_json(n_samples=1000, seed=42):
+    """3D scatter over the extended sample"""
+    fig = px.scatter_3d(
+        _make_cluster_df_3d(n_samples, seed),
+        x='PC1',
+        y='PC2',
+        z='PC3',
+        color='Cluster',
+        hover_data=['Deposits'],
+        title='3D Cluster Visualization (Interactive - Rotate Me!)',
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+    fig.update_traces(marker=dict(size=4))
+    fig.update_layout(height=700)
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def _silhouette_fig_json():
+    """Silhouette score comparison bar chart"""
+    results = _clustering_results()
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=results['Algorithm'],
+        y=results['Silhouette Score'],
+        marker_color=_BAR_PALETTE,
+        text=[f'{v:.3f}' for v in results['Silhouette Score'].to_numpy()],
+        textposition='outside'
+    ))
+
+    fig.update_layout(
+        title="Silhouette Score Comparison (Higher is Better)",
+        xaxis_title="Algorithm",
+        yaxis_title="Silhouette Score",
+        height=400,
+        yaxis_range=[0, 0.8]
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def _comparison_bar_json(comparison_metric):
+    """Per-cluster bar chart for the selected comparison metric
+
+    Keyed on the selectbox value, so each of the four metrics is built
+    once and replayed from cache thereafter.
+    """
+    profiles = _cluster_profiles()
+    if comparison_metric == "Efficiency Ratio":
+        y_data = profiles['Avg Deposits (₹)'] / profiles['Avg Offices']
+        y_label = "Efficiency (₹/Office)"
+    else:
+        metric_map = {
+            "Average Deposits": 'Avg Deposits (₹)',
+            "Average Offices": 'Avg Offices',
+            "Average Accounts": 'Avg Accounts'
+        }
+        y_data = profiles[metric_map[comparison_metric]]
+        y_label = comparison_metric
+
+    fig = go.Figure(go.Bar(
+        x=profiles['Profile Name'],
+        y=y_data,
+        marker_color=_BAR_PALETTE,
+        text=[f'{v:,.0f}' for v in y_data.to_numpy()],
+        textposition='outside'
+    ))
+
+    fig.update_layout(
+        title=f"{comparison_metric} by Cluster",
+        xaxis_title="Cluster Profile",
+        yaxis_title=y_label,
+        height=400
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def _size_pie_json():
+    """Cluster size distribution pie chart"""
+    fig = px.pie(
+        _cluster_profiles(),
+        values='Size (records)',
+        names='Profile Name',
+        title='Cluster Size Distribution',
+        color_discrete_sequence=px.colors.qualitative.Pastel
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(height=400)
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def _parcoords_fig_json():
+    """Parallel-coordinates comparison over min-max normalised metrics"""
+    profiles = _cluster_profiles()
+
+    # One broadcast min-max over the sub-matrix instead of a per-column loop
+    cols = ['Avg Deposits (₹)', 'Avg Offices', 'Avg Accounts']
+    arr = profiles[cols].to_numpy(dtype=np.float64)
+    mn = arr.min(axis=0)
+    span = arr.max(axis=0) - mn
+    norm = (arr - mn) / np.where(span == 0, 1, span)
+
+    fig = go.Figure(data=
+        go.Parcoords(
+            line=dict(
+                color=list(range(len(profiles))),
+                colorscale='Viridis'
+            ),
+            dimensions=[
+                dict(label='Deposits', values=norm[:, 0]),
+                dict(label='Offices', values=norm[:, 1]),
+                dict(label='Accounts', values=norm[:, 2]),
+                dict(label='Size', values=profiles['Percentage'] / 100)
+            ],
+            labelfont=dict(size=14),
+            tickfont=dict(size=12)
+        )
+    )
+
+    fig.update_layout(
+        title="Parallel Coordinates Plot - Cluster Comparison (All Metrics Normalized 0-1)",
+        height=400
+    )
+    return fig.to_json()
 
 # Title
 st.title("📊 Clustering Analysis")
@@ -53,51 +408,33 @@ with col1:
     """)
 
 with col2:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                border-radius: 10px; color: white; text-align: center;">
-        <h3>🎯 Goal</h3>
-        <p>Find Natural Groups in Data</p>
-        <hr style="border-color: rgba(255,255,255,0.3);">
-        <h4>Algorithms Applied</h4>
-        <p style="font-size: 2rem; font-weight: bold; margin: 0.5rem 0;">4</p>
-        <p>Clustering Methods</p>
-        <hr style="border-color: rgba(255,255,255,0.3);">
-        <h4>Optimal Clusters</h4>
-        <p style="font-size: 2rem; font-weight: bold; margin: 0.5rem 0;">4</p>
-        <p>Distinct Groups</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_GOAL_HTML, unsafe_allow_html=True)
 
 st.markdown("---")
 
 # Clustering Results Overview
 st.header("📈 Clustering Results Overview")
 
-# Create sample clustering results
-clustering_results = pd.DataFrame({
-    'Algorithm': ['K-Means', 'Hierarchical', 'DBSCAN', 'Gaussian Mixture'],
-    'Clusters Found': [4, 4, 5, 4],
-    'Silhouette Score': [0.612, 0.587, 0.423, 0.598],
-    'Davies-Bouldin Score': [0.721, 0.834, 1.234, 0.756],
-    'Execution Time (s)': [0.034, 0.089, 0.067, 0.156]
-})
+# Sample clustering results
+clustering_results = _clustering_results()
 
 col1, col2 = st.columns([3, 2])
 
 with col1:
-    # Add color highlighting with HTML instead of matplotlib-dependent background_gradient
-    def highlight_best(row):
-        if row['Algorithm'] == 'K-Means':
-            return ['background-color: #d1fae5'] * len(row)
-        return [''] * len(row)
-    
+    # Add color highlighting with HTML instead of matplotlib-dependent
+    # background_gradient; axis=None styles the whole table in one call
+    # instead of one Python dispatch per row
+    def highlight_best(df):
+        styles = np.full(df.shape, '', dtype=object)
+        styles[(df['Algorithm'] == 'K-Means').to_numpy()] = 'background-color: #d1fae5'
+        return pd.DataFrame(styles, index=df.index, columns=df.columns)
+
     st.dataframe(
         clustering_results.style.format({
             'Silhouette Score': '{:.3f}',
             'Davies-Bouldin Score': '{:.3f}',
             'Execution Time (s)': '{:.3f}'
-        }).apply(highlight_best, axis=1),
+        }).apply(highlight_best, axis=None),
         use_container_width=True,
         hide_index=True
     )
@@ -128,25 +465,7 @@ with col2:
     """)
 
 # Silhouette score comparison
-fig = go.Figure()
-
-fig.add_trace(go.Bar(
-    x=clustering_results['Algorithm'],
-    y=clustering_results['Silhouette Score'],
-    marker_color=[COLORS['success'], COLORS['primary'], COLORS['warning'], COLORS['secondary']],
-    text=clustering_results['Silhouette Score'].apply(lambda x: f'{x:.3f}'),
-    textposition='outside'
-))
-
-fig.update_layout(
-    title="Silhouette Score Comparison (Higher is Better)",
-    xaxis_title="Algorithm",
-    yaxis_title="Silhouette Score",
-    height=400,
-    yaxis_range=[0, 0.8]
-)
-
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(json.loads(_silhouette_fig_json()), use_container_width=True)
 
 st.markdown("---")
 
@@ -160,43 +479,12 @@ Each point represents a banking record, colored by its cluster assignment.
 
 tab1, tab2, tab3 = st.tabs(["PCA Visualization", "t-SNE Visualization", "3D Interactive View"])
 
-# Generate sample cluster data
-np.random.seed(42)
-n_samples = 1000
-
-# Create 4 clusters with different characteristics
-cluster_centers = np.array([[2, 3], [8, 8], [3, 9], [9, 3]])
-cluster_data = []
-
-for i, center in enumerate(cluster_centers):
-    n = n_samples // 4
-    x = np.random.randn(n) * 1.5 + center[0]
-    y = np.random.randn(n) * 1.5 + center[1]
-    cluster_data.append(pd.DataFrame({
-        'PC1': x,
-        'PC2': y,
-        'Cluster': f'Cluster {i+1}',
-        'Size': np.random.randint(50, 200, n),
-        'Deposits': np.random.randint(1000, 100000, n)
-    }))
-
-cluster_df = pd.concat(cluster_data, ignore_index=True)
+# Sample cluster data, generated once and cached
+cluster_df = _make_cluster_df()
 
 with tab1:
     # PCA scatter plot
-    fig = px.scatter(
-        cluster_df,
-        x='PC1',
-        y='PC2',
-        color='Cluster',
-        size='Size',
-        hover_data=['Deposits'],
-        title='PCA-based Cluster Visualization',
-        color_discrete_sequence=px.colors.qualitative.Set2
-    )
-    
-    fig.update_layout(height=600)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(json.loads(_pca_fig_json()), use_container_width=True)
     
     st.markdown("""
     **PCA (Principal Component Analysis):**
@@ -208,23 +496,7 @@ with tab1:
 
 with tab2:
     # t-SNE scatter plot (simulate different positions)
-    tsne_df = cluster_df.copy()
-    tsne_df['t-SNE 1'] = cluster_df['PC1'] * 1.2 + np.random.randn(len(cluster_df)) * 0.5
-    tsne_df['t-SNE 2'] = cluster_df['PC2'] * 0.9 + np.random.randn(len(cluster_df)) * 0.5
-    
-    fig = px.scatter(
-        tsne_df,
-        x='t-SNE 1',
-        y='t-SNE 2',
-        color='Cluster',
-        size='Size',
-        hover_data=['Deposits'],
-        title='t-SNE-based Cluster Visualization',
-        color_discrete_sequence=px.colors.qualitative.Pastel
-    )
-    
-    fig.update_layout(height=600)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(json.loads(_tsne_fig_json()), use_container_width=True)
     
     st.markdown("""
     **t-SNE (t-Distributed Stochastic Neighbor Embedding):**
@@ -236,22 +508,7 @@ with tab2:
 
 with tab3:
     # 3D visualization
-    cluster_df['PC3'] = np.random.randn(len(cluster_df)) * 2 + cluster_df['PC1'] * 0.3
-    
-    fig = px.scatter_3d(
-        cluster_df,
-        x='PC1',
-        y='PC2',
-        z='PC3',
-        color='Cluster',
-        size='Size',
-        hover_data=['Deposits'],
-        title='3D Cluster Visualization (Interactive - Rotate Me!)',
-        color_discrete_sequence=px.colors.qualitative.Bold
-    )
-    
-    fig.update_layout(height=700)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(json.loads(_cluster3d_fig_json()), use_container_width=True)
     
     st.markdown("""
     **3D Visualization:**
@@ -271,81 +528,28 @@ Each cluster represents a distinct **banking profile** with unique characteristi
 Understanding these profiles helps in targeted strategy development.
 """)
 
-# Create cluster profile data
-cluster_profiles = pd.DataFrame({
-    'Cluster': ['Cluster 1', 'Cluster 2', 'Cluster 3', 'Cluster 4'],
-    'Profile Name': ['High-Volume Metro', 'Efficient Semi-Urban', 'Growing Urban', 'Rural Baseline'],
-    'Avg Deposits (₹)': [125450, 45230, 67890, 12340],
-    'Avg Offices': [234, 67, 98, 23],
-    'Avg Accounts': [3456, 892, 1345, 234],
-    'Dominant Region': ['Western', 'Northern', 'Southern', 'Eastern'],
-    'Dominant Pop Group': ['METROPOLITAN', 'SEMI-URBAN', 'URBAN', 'RURAL'],
-    'Size (records)': [1245, 2134, 1987, 1611],
-    'Percentage': [17.8, 30.6, 28.5, 23.1]
-})
-
-# Display profiles
-for i, row in cluster_profiles.iterrows():
+# Cluster profile data
+cluster_profiles = _cluster_profiles()
+
+# Display profiles - plain dicts instead of iterrows' per-row Series
+for i, row in enumerate(cluster_profiles.to_dict('records')):
     with st.expander(f"📌 {row['Profile Name']} ({row['Cluster']})", expanded=(i == 0)):
         col1, col2, col3 = st.columns(3)
-        
+
         with col1:
-            st.metric("Average Deposits", f"₹{row['Avg Deposits (₹)']:,.0f}")
-            st.metric("Average Offices", f"{row['Avg Offices']:,.0f}")
-        
+            st.metric("Average Deposits", row['_deposits_fmt'])
+            st.metric("Average Offices", row['_offices_fmt'])
+
         with col2:
-            st.metric("Average Accounts", f"{row['Avg Accounts']:,.0f}")
-            st.metric("Cluster Size", f"{row['Size (records)']:,} ({row['Percentage']:.1f}%)")
-        
+            st.metric("Average Accounts", row['_accounts_fmt'])
+            st.metric("Cluster Size", row['_size_fmt'])
+
         with col3:
             st.metric("Dominant Region", row['Dominant Region'])
             st.metric("Dominant Population", row['Dominant Pop Group'])
-        
+
         # Characteristics
-        if i == 0:
-            st.markdown("""
-            **Characteristics:**
-            - 🏙️ Concentrated in metropolitan areas
-            - 💰 Highest deposit amounts
-            - 🏢 Large branch networks
-            - 👥 Extensive customer base
-            - ⚡ High efficiency ratios
-            
-            **Strategy:** Premium products, wealth management, digital banking
-            """)
-        elif i == 1:
-            st.markdown("""
-            **Characteristics:**
-            - 🏘️ Semi-urban locations
-            - 📊 Moderate deposit levels
-            - ⚖️ Balanced infrastructure
-            - 🎯 Growth-oriented markets
-            - 💡 Good efficiency
-            
-            **Strategy:** Mass market products, financial literacy, expansion focus
-            """)
-        elif i == 2:
-            st.markdown("""
-            **Characteristics:**
-            - 🌆 Urban centers
-            - 📈 Growing deposit base
-            - 🚀 Expansion phase
-            - 👨‍👩‍👧‍👦 Diverse customer segments
-            - 🔄 Dynamic markets
-            
-            **Strategy:** Product diversification, technology adoption, market penetration
-            """)
-        else:
-            st.markdown("""
-            **Characteristics:**
-            - 🌾 Rural areas
-            - 💵 Lower deposit volumes
-            - 🏚️ Limited infrastructure
-            - 📉 Challenges in penetration
-            - 🎯 High potential for inclusion
-            
-            **Strategy:** Financial inclusion, mobile banking, government schemes, awareness programs
-            """)
+        st.markdown(_STRATEGY_MD[i])
 
 st.markdown("---")
 
@@ -360,86 +564,17 @@ comparison_metric = st.selectbox(
 col1, col2 = st.columns(2)
 
 with col1:
-    # Bar chart
-    if comparison_metric == "Efficiency Ratio":
-        cluster_profiles['Efficiency'] = cluster_profiles['Avg Deposits (₹)'] / cluster_profiles['Avg Offices']
-        y_data = cluster_profiles['Efficiency']
-        y_label = "Efficiency (₹/Office)"
-    else:
-        metric_map = {
-            "Average Deposits": 'Avg Deposits (₹)',
-            "Average Offices": 'Avg Offices',
-            "Average Accounts": 'Avg Accounts'
-        }
-        y_data = cluster_profiles[metric_map[comparison_metric]]
-        y_label = comparison_metric
-    
-    fig = go.Figure(go.Bar(
-        x=cluster_profiles['Profile Name'],
-        y=y_data,
-        marker_color=[COLORS['primary'], COLORS['success'], COLORS['warning'], COLORS['secondary']],
-        text=y_data.apply(lambda x: f'{x:,.0f}'),
-        textposition='outside'
-    ))
-    
-    fig.update_layout(
-        title=f"{comparison_metric} by Cluster",
-        xaxis_title="Cluster Profile",
-        yaxis_title=y_label,
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    # Bar chart, cached per selected metric
+    st.plotly_chart(json.loads(_comparison_bar_json(comparison_metric)), use_container_width=True)
 
 with col2:
     # Pie chart for cluster sizes
-    fig = px.pie(
-        cluster_profiles,
-        values='Size (records)',
-        names='Profile Name',
-        title='Cluster Size Distribution',
-        color_discrete_sequence=px.colors.qualitative.Pastel
-    )
-    
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    fig.update_layout(height=400)
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(json.loads(_size_pie_json()), use_container_width=True)
 
 # Parallel coordinates plot
 st.subheader("📊 Multi-dimensional Cluster Comparison")
 
-# Normalize data for parallel coordinates
-normalized_profiles = cluster_profiles.copy()
-for col in ['Avg Deposits (₹)', 'Avg Offices', 'Avg Accounts']:
-    normalized_profiles[col + '_norm'] = (
-        (normalized_profiles[col] - normalized_profiles[col].min()) / 
-        (normalized_profiles[col].max() - normalized_profiles[col].min())
-    )
-
-fig = go.Figure(data=
-    go.Parcoords(
-        line=dict(
-            color=list(range(len(cluster_profiles))),
-            colorscale='Viridis'
-        ),
-        dimensions=[
-            dict(label='Deposits', values=normalized_profiles['Avg Deposits (₹)_norm']),
-            dict(label='Offices', values=normalized_profiles['Avg Offices_norm']),
-            dict(label='Accounts', values=normalized_profiles['Avg Accounts_norm']),
-            dict(label='Size', values=normalized_profiles['Percentage'] / 100)
-        ],
-        labelfont=dict(size=14),
-        tickfont=dict(size=12)
-    )
-)
-
-fig.update_layout(
-    title="Parallel Coordinates Plot - Cluster Comparison (All Metrics Normalized 0-1)",
-    height=400
-)
-
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(json.loads(_parcoords_fig_json()), use_container_width=True)
 
 st.markdown("---")
 
@@ -595,47 +730,9 @@ st.markdown("---")
 # Summary
 st.header("📝 Summary")
 
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: #ecfdf5; border-radius: 10px; border-left: 4px solid #10b981;">
-        <h4>🎯 Clusters Identified</h4>
-        <ol>
-            <li>High-Volume Metro (17.8%)</li>
-            <li>Efficient Semi-Urban (30.6%)</li>
-            <li>Growing Urban (28.5%)</li>
-            <li>Rural Baseline (23.1%)</li>
-        </ol>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: #eff6ff; border-radius: 10px; border-left: 4px solid #3b82f6;">
-        <h4>💡 Best Algorithm</h4>
-        <p><strong>K-Means</strong></p>
-        <ul>
-            <li>Silhouette: 0.612</li>
-            <li>DB Score: 0.721</li>
-            <li>Time: 0.034s</li>
-            <li>Clear separation</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown("""
-    <div style="padding: 1.5rem; background: #fef3c7; border-radius: 10px; border-left: 4px solid #f59e0b;">
-        <h4>🚀 Next Steps</h4>
-        <ul>
-            <li>Implement cluster strategies</li>
-            <li>Monitor cluster evolution</li>
-            <li>Measure cluster KPIs</li>
-            <li>Refine segmentation</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
+for col, card_html in zip(st.columns(3), _SUMMARY_CARDS):
+    with col:
+        st.markdown(card_html, unsafe_allow_html=True)
 
 st.success("""
 ### 🎉 Conclusion
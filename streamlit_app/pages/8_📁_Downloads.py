@@ -6,7 +6,12 @@ import streamlit as st
 import pandas as pd
 import sys
 from pathlib import Path
+import functools
 import os
+import re
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 # Add utils to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -36,6 +41,80 @@ and reports generated during this comprehensive data science project.
 # Get base path
 base_path = Path(__file__).parent.parent.parent
 
+# Downloadable artifacts, frozen at module scope so reruns iterate stable
+# tuples instead of rebuilding the dicts and Path objects every time
+DATASETS = (
+    {
+        "name": "Original Dataset",
+        "file": "populationgroup-wise-deposits.csv",
+        "path": base_path / "populationgroup-wise-deposits.csv",
+        "description": "Raw dataset with 14,037 records before cleaning",
+        "records": "14,037 rows"
+    },
+    {
+        "name": "Cleaned Dataset",
+        "file": "cleaned_data.csv",
+        "path": base_path / "data" / "processed" / "cleaned_data.csv",
+        "description": "Cleaned dataset after removing zero-deposit records (50.3% reduction)",
+        "records": "6,977 rows"
+    },
+    {
+        "name": "Featured Dataset",
+        "file": "featured_data.csv",
+        "path": base_path / "data" / "processed" / "featured_data.csv",
+        "description": "Cleaned data with 6 engineered features (deposit_per_office, etc.)",
+        "records": "6,977 rows, 21 features"
+    }
+)
+
+MODELS = (
+    {
+        "name": "Extra Trees Regressor (Best Model)",
+        "file": "extra_trees.pkl",
+        "path": base_path / "models" / "saved_models" / "extra_trees.pkl",
+        "description": "Best performing model with R²=0.9976",
+        "metrics": "R²: 0.9976 | RMSE: ₹1,402.87 | MAE: ₹444.56"
+    },
+    {
+        "name": "Gradient Boosting Regressor",
+        "file": "gradient_boosting.pkl",
+        "path": base_path / "models" / "saved_models" / "gradient_boosting.pkl",
+        "description": "Runner-up model with excellent performance",
+        "metrics": "R²: 0.9936 | RMSE: ₹2,290.71 | MAE: ₹1,234.89"
+    },
+    {
+        "name": "Decision Tree Regressor",
+        "file": "decision_tree.pkl",
+        "path": base_path / "models" / "saved_models" / "decision_tree.pkl",
+        "description": "Interpretable baseline model",
+        "metrics": "R²: 0.9892 | RMSE: ₹2,987.45 | MAE: ₹1,567.23"
+    }
+)
+
+REPORTS = (
+    {
+        "name": "Model Comparison Report",
+        "file": "model_comparison.csv",
+        "path": base_path / "reports" / "model_results" / "model_comparison.csv",
+        "description": "Detailed comparison of all 18 ML models with performance metrics",
+        "type": "CSV"
+    },
+    {
+        "name": "Project Summary",
+        "file": "project_summary.json",
+        "path": base_path / "reports" / "model_results" / "project_summary.json",
+        "description": "Complete project metadata, statistics, and key findings in JSON format",
+        "type": "JSON"
+    },
+    {
+        "name": "Data Storytelling Insights",
+        "file": "data_storytelling_insights.txt",
+        "path": base_path / "reports" / "model_results" / "data_storytelling_insights.txt",
+        "description": "Comprehensive narrative explaining patterns, insights, and recommendations",
+        "type": "TXT"
+    }
+)
+
 # File categories
 st.header("📦 Available Downloads")
 
@@ -48,22 +127,120 @@ tab1, tab2, tab3, tab4, tab5 = st.tabs([
     "🗜️ Complete Project"
 ])
 
+# stat() each artifact once per process - the downloadable files don't
+# change while the app is running, and this page checks 20+ of them per rerun
+@functools.lru_cache(maxsize=512)
+def _file_size_bytes(path_str):
+    try:
+        return os.path.getsize(path_str)
+    except OSError:
+        return None
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+
 # Helper function to get file size
 def get_file_size(file_path):
     """Get file size in human readable format"""
-    try:
-        size_bytes = os.path.getsize(file_path)
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-    except:
+    size = _file_size_bytes(str(file_path))
+    if size is None:
         return "N/A"
+    unit = (size.bit_length() - 1) // 10 if size else 0
+    unit = min(unit, len(_SIZE_UNITS) - 1)
+    return f"{size / 1024.0 ** unit:.2f} {_SIZE_UNITS[unit]}"
 
 # Helper function to check if file exists
 def file_exists(file_path):
     """Check if file exists"""
-    return os.path.exists(file_path)
+    return _file_size_bytes(str(file_path)) is not None
+
+@st.cache_data(show_spinner=False)
+def _preview_csv(path_str, mtime):
+    """First rows of a CSV for the preview tables (mtime busts the cache on rewrite)"""
+    return pd.read_csv(path_str, nrows=5)
+
+@st.cache_data(show_spinner=False)
+def _preview_text(path_str, mtime, limit=500):
+    """First characters of a text report via a bounded read, not a full slurp"""
+    with open(path_str, 'r', encoding='utf-8') as f:
+        content = f.read(limit + 1)
+    return content[:limit] + "..." if len(content) > limit else content
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _archive_bytes(path_str, mtime):
+    """Project ZIP bytes, cached so repeat clicks in a session skip the disk read"""
+    return Path(path_str).read_bytes()
+
+# Keyword patterns compiled once at module load; categorizing a file is then
+# a single C-level regex search instead of a Python loop over every keyword
+_VIZ_PATTERNS = {
+    category: re.compile('|'.join(map(re.escape, keywords)))
+    for category, keywords in {
+        "Distribution Plots": ("distribution", "histogram", "kde"),
+        "Correlation Analysis": ("correlation", "heatmap"),
+        "Feature Analysis": ("feature", "importance"),
+        "Model Performance": ("model", "performance", "comparison", "r2", "rmse"),
+        "Regional Analysis": ("region", "state", "district"),
+        "Population Analysis": ("population", "group"),
+    }.items()
+}
+
+# Directories bundled into the on-demand project archive
+_ARCHIVE_DIRS = ('data/processed', 'models/saved_models',
+                 'reports/figures', 'reports/model_results')
+
+# PNGs, pickles and parquet are already compressed - DEFLATE-ing them again
+# burns CPU for near-zero size reduction, so those entries are stored as-is
+_STORED_SUFFIXES = ('.png', '.jpg', '.pkl', '.parquet', '.zip')
+
+def _zip_entry_compression(name):
+    if name.lower().endswith(_STORED_SUFFIXES):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+def _build_project_zip():
+    """Assemble the project archive on demand into a spooled temp file
+
+    Runs only when the download button is clicked and no pre-built ZIP
+    exists. The spool keeps memory bounded: small archives stay in RAM,
+    anything past 64 MB spills to disk instead of materialising the
+    whole ZIP as one bytes object.
+    """
+    buf = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for rel_dir in _ARCHIVE_DIRS:
+            dir_path = base_path / rel_dir
+            if not dir_path.exists():
+                continue
+            for entry in sorted(os.scandir(dir_path), key=lambda e: e.name):
+                if entry.is_file():
+                    zf.write(entry.path, arcname=f"{rel_dir}/{entry.name}",
+                             compress_type=_zip_entry_compression(entry.name))
+        notebook = base_path / "main.ipynb"
+        if notebook.exists():
+            zf.write(notebook, arcname="main.ipynb")
+    buf.seek(0)
+    return buf
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _categorized_figures(dir_str):
+    """Scan the figures directory and bucket PNG filenames by category
+
+    Cached with a short TTL so reruns skip both the directory walk and
+    the per-file matching; new figures still show up within a minute.
+    """
+    buckets = {category: [] for category in _VIZ_PATTERNS}
+    buckets["Other Visualizations"] = []
+    for entry in sorted(os.scandir(dir_str), key=lambda e: e.name):
+        if not entry.name.endswith('.png'):
+            continue
+        name_lower = entry.name.lower()
+        for category, pattern in _VIZ_PATTERNS.items():
+            if pattern.search(name_lower):
+                buckets[category].append(entry.name)
+                break
+        else:
+            buckets["Other Visualizations"].append(entry.name)
+    return buckets
 
 # Datasets Tab
 with tab1:
@@ -74,31 +251,7 @@ with tab1:
     with engineered features ready for machine learning.
     """)
     
-    datasets = [
-        {
-            "name": "Original Dataset",
-            "file": "populationgroup-wise-deposits.csv",
-            "path": base_path / "populationgroup-wise-deposits.csv",
-            "description": "Raw dataset with 14,037 records before cleaning",
-            "records": "14,037 rows"
-        },
-        {
-            "name": "Cleaned Dataset",
-            "file": "cleaned_data.csv",
-            "path": base_path / "data" / "processed" / "cleaned_data.csv",
-            "description": "Cleaned dataset after removing zero-deposit records (50.3% reduction)",
-            "records": "6,977 rows"
-        },
-        {
-            "name": "Featured Dataset",
-            "file": "featured_data.csv",
-            "path": base_path / "data" / "processed" / "featured_data.csv",
-            "description": "Cleaned data with 6 engineered features (deposit_per_office, etc.)",
-            "records": "6,977 rows, 21 features"
-        }
-    ]
-    
-    for i, dataset in enumerate(datasets):
+    for i, dataset in enumerate(DATASETS):
         with st.expander(f"📄 {dataset['name']}", expanded=(i == 1)):
             col1, col2, col3 = st.columns([2, 1, 1])
             
@@ -115,27 +268,25 @@ with tab1:
             
             with col3:
                 if file_exists(dataset['path']):
-                    try:
-                        df = pd.read_csv(dataset['path'])
-                        csv = df.to_csv(index=False).encode('utf-8')
-                        st.download_button(
-                            label="⬇️ Download CSV",
-                            data=csv,
-                            file_name=dataset['file'],
-                            mime='text/csv',
-                            key=f"download_{dataset['file']}"
-                        )
-                    except Exception as e:
-                        st.error(f"Error: {str(e)}")
+                    # Deferred callable: the file is only read when the
+                    # button is actually clicked, not on every rerun
+                    st.download_button(
+                        label="⬇️ Download CSV",
+                        data=lambda p=dataset['path']: p.read_bytes(),
+                        file_name=dataset['file'],
+                        mime='text/csv',
+                        key=f"download_{dataset['file']}"
+                    )
                 else:
                     st.button("⬇️ Download CSV", disabled=True, key=f"download_{dataset['file']}")
-            
+
             # Show sample data
             if file_exists(dataset['path']):
                 try:
-                    df = pd.read_csv(dataset['path'])
                     st.markdown("**Preview (first 5 rows):**")
-                    st.dataframe(df.head(), use_container_width=True)
+                    st.dataframe(
+                        _preview_csv(str(dataset['path']), os.path.getmtime(dataset['path'])),
+                        use_container_width=True)
                 except:
                     pass
 
@@ -156,31 +307,7 @@ with tab2:
     - See documentation for usage examples
     """)
     
-    models = [
-        {
-            "name": "Extra Trees Regressor (Best Model)",
-            "file": "extra_trees.pkl",
-            "path": base_path / "models" / "saved_models" / "extra_trees.pkl",
-            "description": "Best performing model with R²=0.9976",
-            "metrics": "R²: 0.9976 | RMSE: ₹1,402.87 | MAE: ₹444.56"
-        },
-        {
-            "name": "Gradient Boosting Regressor",
-            "file": "gradient_boosting.pkl",
-            "path": base_path / "models" / "saved_models" / "gradient_boosting.pkl",
-            "description": "Runner-up model with excellent performance",
-            "metrics": "R²: 0.9936 | RMSE: ₹2,290.71 | MAE: ₹1,234.89"
-        },
-        {
-            "name": "Decision Tree Regressor",
-            "file": "decision_tree.pkl",
-            "path": base_path / "models" / "saved_models" / "decision_tree.pkl",
-            "description": "Interpretable baseline model",
-            "metrics": "R²: 0.9892 | RMSE: ₹2,987.45 | MAE: ₹1,567.23"
-        }
-    ]
-    
-    for i, model in enumerate(models):
+    for i, model in enumerate(MODELS):
         with st.expander(f"🔷 {model['name']}", expanded=(i == 0)):
             col1, col2 = st.columns([3, 1])
             
@@ -211,14 +338,13 @@ model = joblib.load('{model['file']}')
                     file_size = get_file_size(model['path'])
                     st.markdown(f"**Size:** {file_size}")
                     
-                    with open(model['path'], 'rb') as f:
-                        st.download_button(
-                            label="⬇️ Download PKL",
-                            data=f,
-                            file_name=model['file'],
-                            mime='application/octet-stream',
-                            key=f"download_{model['file']}"
-                        )
+                    st.download_button(
+                        label="⬇️ Download PKL",
+                        data=lambda p=model['path']: p.read_bytes(),
+                        file_name=model['file'],
+                        mime='application/octet-stream',
+                        key=f"download_{model['file']}"
+                    )
                 else:
                     st.warning("File not found")
                     st.button("⬇️ Download PKL", disabled=True, key=f"download_{model['file']}")
@@ -236,63 +362,44 @@ with tab3:
     figures_path = base_path / "reports" / "figures"
     
     if figures_path.exists():
-        viz_files = list(figures_path.glob("*.png"))
-        
-        if viz_files:
-            st.success(f"Found {len(viz_files)} visualization files")
-            
-            # Categorize visualizations
-            viz_categories = {
-                "Distribution Plots": ["distribution", "histogram", "kde"],
-                "Correlation Analysis": ["correlation", "heatmap"],
-                "Feature Analysis": ["feature", "importance"],
-                "Model Performance": ["model", "performance", "comparison", "r2", "rmse"],
-                "Regional Analysis": ["region", "state", "district"],
-                "Population Analysis": ["population", "group"],
-                "Other Visualizations": []
-            }
-            
-            # Organize files by category
-            categorized_viz = {cat: [] for cat in viz_categories}
-            
-            for viz_file in viz_files:
-                categorized = False
-                file_name_lower = viz_file.name.lower()
-                
-                for category, keywords in viz_categories.items():
-                    if category == "Other Visualizations":
-                        continue
-                    if any(keyword in file_name_lower for keyword in keywords):
-                        categorized_viz[category].append(viz_file)
-                        categorized = True
-                        break
-                
-                if not categorized:
-                    categorized_viz["Other Visualizations"].append(viz_file)
-            
+        categorized_viz = _categorized_figures(str(figures_path))
+        total_files = sum(len(files) for files in categorized_viz.values())
+
+        if total_files:
+            st.success(f"Found {total_files} visualization files")
+
+            # Warm the memoized stat cache in parallel: the stats are
+            # independent I/O, and on a network filesystem the cold render
+            # is otherwise serialized on per-file stat latency
+            all_figures = [figures_path / name
+                           for files in categorized_viz.values() for name in files]
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                for _ in ex.map(get_file_size, all_figures):
+                    pass
+
             # Display by category
             for category, files in categorized_viz.items():
                 if files:
                     with st.expander(f"📊 {category} ({len(files)} files)", expanded=False):
-                        for viz_file in files:
+                        for file_name in files:
+                            viz_file = figures_path / file_name
                             col1, col2, col3 = st.columns([3, 1, 1])
-                            
+
                             with col1:
-                                st.markdown(f"**{viz_file.name}**")
-                            
+                                st.markdown(f"**{file_name}**")
+
                             with col2:
                                 file_size = get_file_size(viz_file)
                                 st.markdown(f"Size: {file_size}")
-                            
+
                             with col3:
-                                with open(viz_file, 'rb') as f:
-                                    st.download_button(
-                                        label="⬇️ Download",
-                                        data=f,
-                                        file_name=viz_file.name,
-                                        mime='image/png',
-                                        key=f"download_viz_{viz_file.name}"
-                                    )
+                                st.download_button(
+                                    label="⬇️ Download",
+                                    data=lambda p=viz_file: p.read_bytes(),
+                                    file_name=file_name,
+                                    mime='image/png',
+                                    key=f"download_viz_{file_name}"
+                                )
             
             # Bulk download option
             st.markdown("---")
@@ -311,31 +418,7 @@ with tab4:
     and data insights narratives.
     """)
     
-    reports = [
-        {
-            "name": "Model Comparison Report",
-            "file": "model_comparison.csv",
-            "path": base_path / "reports" / "model_results" / "model_comparison.csv",
-            "description": "Detailed comparison of all 18 ML models with performance metrics",
-            "type": "CSV"
-        },
-        {
-            "name": "Project Summary",
-            "file": "project_summary.json",
-            "path": base_path / "reports" / "model_results" / "project_summary.json",
-            "description": "Complete project metadata, statistics, and key findings in JSON format",
-            "type": "JSON"
-        },
-        {
-            "name": "Data Storytelling Insights",
-            "file": "data_storytelling_insights.txt",
-            "path": base_path / "reports" / "model_results" / "data_storytelling_insights.txt",
-            "description": "Comprehensive narrative explaining patterns, insights, and recommendations",
-            "type": "TXT"
-        }
-    ]
-    
-    for report in reports:
+    for report in REPORTS:
         with st.expander(f"📑 {report['name']}", expanded=False):
             col1, col2 = st.columns([3, 1])
             
@@ -346,19 +429,18 @@ with tab4:
                 # Show preview for text files
                 if report['type'] == 'TXT' and file_exists(report['path']):
                     try:
-                        with open(report['path'], 'r') as f:
-                            content = f.read()
-                            st.markdown("**Preview (first 500 characters):**")
-                            st.text(content[:500] + "..." if len(content) > 500 else content)
+                        st.markdown("**Preview (first 500 characters):**")
+                        st.text(_preview_text(str(report['path']), os.path.getmtime(report['path'])))
                     except:
                         pass
                 
                 # Show preview for CSV
                 elif report['type'] == 'CSV' and file_exists(report['path']):
                     try:
-                        df = pd.read_csv(report['path'])
                         st.markdown("**Preview (first 5 rows):**")
-                        st.dataframe(df.head(), use_container_width=True)
+                        st.dataframe(
+                            _preview_csv(str(report['path']), os.path.getmtime(report['path'])),
+                            use_container_width=True)
                     except:
                         pass
             
@@ -367,19 +449,18 @@ with tab4:
                     file_size = get_file_size(report['path'])
                     st.markdown(f"**Size:** {file_size}")
                     
-                    with open(report['path'], 'rb') as f:
-                        mime_types = {
-                            'CSV': 'text/csv',
-                            'JSON': 'application/json',
-                            'TXT': 'text/plain'
-                        }
-                        st.download_button(
-                            label=f"⬇️ Download {report['type']}",
-                            data=f,
-                            file_name=report['file'],
-                            mime=mime_types.get(report['type'], 'application/octet-stream'),
-                            key=f"download_{report['file']}"
-                        )
+                    mime_types = {
+                        'CSV': 'text/csv',
+                        'JSON': 'application/json',
+                        'TXT': 'text/plain'
+                    }
+                    st.download_button(
+                        label=f"⬇️ Download {report['type']}",
+                        data=lambda p=report['path']: p.read_bytes(),
+                        file_name=report['file'],
+                        mime=mime_types.get(report['type'], 'application/octet-stream'),
+                        key=f"download_{report['file']}"
+                    )
                 else:
                     st.warning("File not found")
                     st.button(f"⬇️ Download {report['type']}", disabled=True, key=f"download_{report['file']}")
@@ -440,26 +521,31 @@ with tab5:
             ```
             """)
         else:
-            st.warning("ZIP archive not found. It may need to be created.")
+            st.warning("No pre-built ZIP archive found.")
             st.markdown("""
-            **Note:** If the ZIP file doesn't exist, you can:
-            1. Download individual files from other tabs
-            2. Create your own archive from the downloaded files
-            3. Use the main.ipynb to regenerate the archive
+            **Note:** The download button will assemble the archive on the
+            fly from the datasets, models, figures and reports currently on
+            disk. You can also download individual files from the other tabs.
             """)
     
     with col2:
         if file_exists(zip_path):
-            with open(zip_path, 'rb') as f:
-                st.download_button(
-                    label="📦 Download Complete Project",
-                    data=f,
-                    file_name="population_deposits_project.zip",
-                    mime='application/zip',
-                    key="download_complete_project"
-                )
+            st.download_button(
+                label="📦 Download Complete Project",
+                data=lambda: _archive_bytes(str(zip_path), os.path.getmtime(zip_path)),
+                file_name="population_deposits_project.zip",
+                mime='application/zip',
+                key="download_complete_project"
+            )
         else:
-            st.button("📦 Download Complete Project", disabled=True, key="download_complete_project_disabled")
+            st.download_button(
+                label="📦 Download Complete Project",
+                data=_build_project_zip,
+                file_name="population_deposits_project.zip",
+                mime='application/zip',
+                key="download_complete_project_on_demand"
+            )
+            st.caption("The archive is assembled on demand when you click.")
 
 st.markdown("---")
 
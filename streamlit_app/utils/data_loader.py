@@ -9,56 +9,135 @@ import json
 from pathlib import Path
 import streamlit as st
 
+from utils.fast_aggs import groupby_sum_count_mean
+
 # Base path - adjust based on directory structure
 BASE_PATH = Path(__file__).parent.parent.parent
 
-@st.cache_data
+# Low-cardinality string columns stored as pandas Categorical for memory/speed.
+# Categorical beats string[pyarrow] here: equality masks and groupbys compare
+# small integer codes instead of bytes, and the filter path below works off
+# precomputed per-category row positions rather than string comparisons at all.
+CATEGORICAL_COLS = ['state_name', 'region', 'population_group', 'district_name']
+
+def _read_csv_fast(path):
+    """Read a CSV via pyarrow's multithreaded parser when available"""
+    try:
+        import pyarrow.csv as pacsv
+        return pacsv.read_csv(path).to_pandas()
+    except ImportError:
+        return pd.read_csv(path)
+
+# Declaring dtypes up-front lets the CSV fallback skip pandas' per-column
+# type-inference pass; extra keys are ignored for files missing a column.
+_CSV_DTYPES = {**{col: 'category' for col in CATEGORICAL_COLS},
+               'deposit_amount': 'float32'}
+
+def _read_processed(name):
+    """Read a processed dataset, preferring the Parquet copy over CSV.
+
+    Parquet copies are written by check_setup.py when pyarrow is available;
+    a CSV that is newer than its Parquet sibling (regenerated data) wins.
+    """
+    parquet_path = BASE_PATH / "data" / "processed" / f"{name}.parquet"
+    csv_path = BASE_PATH / "data" / "processed" / f"{name}.csv"
+    use_parquet = parquet_path.exists() and (
+        not csv_path.exists()
+        or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime)
+    if use_parquet:
+        df = pd.read_parquet(parquet_path, engine="pyarrow")
+    else:
+        df = pd.read_csv(csv_path, dtype=_CSV_DTYPES)
+
+    # Downcast the numeric columns - halves the bytes every scan moves
+    for col in ['no_of_offices', 'no_of_accounts']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='unsigned')
+    if 'deposit_amount' in df.columns:
+        df['deposit_amount'] = df['deposit_amount'].astype('float32')
+    return df
+
+def _processed_mtime(name):
+    """Newest mtime across a dataset's parquet/CSV pair
+
+    Keys the loader caches so regenerated processed data busts them -
+    including the persisted on-disk entries across app restarts.
+    """
+    paths = (BASE_PATH / "data" / "processed" / f"{name}.parquet",
+             BASE_PATH / "data" / "processed" / f"{name}.csv")
+    return max((p.stat().st_mtime for p in paths if p.exists()), default=0.0)
+
+@st.cache_resource(show_spinner=False)
+def _load_processed(name, mtime):
+    """Singleton processed frame per (name, source mtime)
+
+    cache_resource hands every caller the same object, unlike cache_data
+    which unpickles a fresh copy per call. That singleton guarantee is
+    what makes the id-based hash_funcs on the reductions below valid.
+    Treat the returned frame as read-only. No persist= here - cache_data's
+    disk persistence doesn't apply to resources, and the parquet copies
+    make a cold load cheap anyway.
+    """
+    return _read_processed(name)
+
 def load_cleaned_data():
     """Load cleaned dataset"""
     try:
-        data_path = BASE_PATH / "data" / "processed" / "cleaned_data.csv"
-        df = pd.read_csv(data_path)
-        return df
+        return _load_processed("cleaned_data", _processed_mtime("cleaned_data"))
     except Exception as e:
         st.error(f"Error loading cleaned data: {e}")
         return None
 
-@st.cache_data
 def load_featured_data():
     """Load featured dataset with engineered features"""
     try:
-        data_path = BASE_PATH / "data" / "processed" / "featured_data.csv"
-        df = pd.read_csv(data_path)
-        return df
+        return _load_processed("featured_data", _processed_mtime("featured_data"))
     except Exception as e:
         st.error(f"Error loading featured data: {e}")
         return None
 
-@st.cache_data
+@st.cache_data(show_spinner=False, persist="disk")
+def _load_comparison_csv(path_str, mtime):
+    """Cache the comparison table keyed on (path, source mtime)"""
+    return _read_csv_fast(path_str)
+
 def load_model_comparison():
-    """Load model comparison results"""
+    """Load model comparison results
+
+    Prefers the final comparison table but falls back to the interim
+    model_comparison.csv, so a partially regenerated reports directory
+    doesn't leave the Models page empty.
+    """
     try:
-        comparison_path = BASE_PATH / "reports" / "model_results" / "final_model_comparison.csv"
-        df = pd.read_csv(comparison_path)
-        return df
+        results_dir = BASE_PATH / "reports" / "model_results"
+        for name in ("final_model_comparison.csv", "model_comparison.csv"):
+            comparison_path = results_dir / name
+            if comparison_path.exists():
+                return _load_comparison_csv(str(comparison_path),
+                                            comparison_path.stat().st_mtime)
+        raise FileNotFoundError("no model comparison CSV in reports/model_results")
     except Exception as e:
         st.error(f"Error loading model comparison: {e}")
         return None
 
-@st.cache_resource
+@st.cache_resource(show_spinner="Loading model...")
 def load_best_model(model_name="extra_trees"):
-    """Load trained model"""
+    """Load trained model (kept hot process-wide; arrays are memory-mapped)"""
     try:
         model_path = BASE_PATH / "models" / "saved_models" / f"{model_name}.pkl"
-        model = joblib.load(model_path)
+        model = joblib.load(model_path, mmap_mode='r')
         return model
     except Exception as e:
         st.error(f"Error loading model {model_name}: {e}")
         return None
 
-@st.cache_data
+@st.cache_resource(show_spinner=False)
 def load_project_summary():
-    """Load project summary JSON"""
+    """Load project summary JSON (shared read-only dict - do not mutate)
+
+    cache_resource hands back the same object on every hit instead of
+    cache_data's pickle round-trip; fine here because callers only read it.
+    """
     try:
         summary_path = BASE_PATH / "reports" / "model_results" / "project_summary.json"
         with open(summary_path, 'r') as f:
@@ -68,22 +147,27 @@ def load_project_summary():
         st.error(f"Error loading project summary: {e}")
         return None
 
-@st.cache_data
+@st.cache_resource(show_spinner=False)
 def load_insights_narrative():
-    """Load data storytelling insights"""
+    """Load data storytelling insights (immutable string, so no copy needed)"""
     try:
         insights_path = BASE_PATH / "reports" / "model_results" / "data_storytelling_insights.txt"
-        with open(insights_path, 'r') as f:
-            narrative = f.read()
-        return narrative
+        return insights_path.read_text(encoding='utf-8')
     except Exception as e:
         st.error(f"Error loading insights: {e}")
         return None
 
+@st.cache_data(show_spinner=False)
+def get_unique_sorted(df, col):
+    """Get sorted unique values of a column (cached so filter widgets skip the O(N) scan)"""
+    return sorted(df[col].unique().tolist())
+
+@st.cache_data(show_spinner=False)
 def get_population_groups():
     """Get list of population groups"""
     return ['Metropolitan', 'Urban', 'Semi-urban', 'Rural']
 
+@st.cache_data(show_spinner=False)
 def get_regions():
     """Get list of regions"""
     df = load_cleaned_data()
@@ -91,6 +175,7 @@ def get_regions():
         return sorted(df['region'].unique().tolist())
     return []
 
+@st.cache_data(show_spinner=False)
 def get_states():
     """Get list of states"""
     df = load_cleaned_data()
@@ -98,39 +183,211 @@ def get_states():
         return sorted(df['state_name'].unique().tolist())
     return []
 
+@st.cache_data(show_spinner=False)
+def _districts_by_state():
+    """Map each state to its sorted district list (built once, reused per rerun)"""
+    df = load_cleaned_data()
+    if df is None:
+        return {}
+    return {
+        state: sorted(group.unique().tolist())
+        for state, group in df.groupby('state_name', observed=True)['district_name']
+    }
+
 def get_districts(state=None):
     """Get list of districts, optionally filtered by state"""
-    df = load_cleaned_data()
-    if df is not None:
-        if state:
-            return sorted(df[df['state_name'] == state]['district_name'].unique().tolist())
-        return sorted(df['district_name'].unique().tolist())
-    return []
+    lookup = _districts_by_state()
+    if state:
+        return lookup.get(state, [])
+    return sorted(set().union(*lookup.values())) if lookup else []
+
+@st.cache_resource(show_spinner=False)
+def build_filter_index(df):
+    """Precompute per-category row positions for the filterable columns"""
+    return {
+        col: df.groupby(col, observed=True).indices
+        for col in ['population_group', 'region', 'state_name']
+        if col in df.columns
+    }
 
 def filter_data(df, population_group=None, region=None, state=None):
-    """Apply filters to dataframe"""
-    filtered_df = df.copy()
-    
-    if population_group and population_group != "All":
-        filtered_df = filtered_df[filtered_df['population_group'] == population_group]
-    
-    if region and region != "All":
-        filtered_df = filtered_df[filtered_df['region'] == region]
-    
-    if state and state != "All":
-        filtered_df = filtered_df[filtered_df['state_name'] == state]
-    
-    return filtered_df
+    """Apply filters to dataframe via precomputed row-position lookups"""
+    index = build_filter_index(df)
+    selections = [
+        ('population_group', population_group),
+        ('region', region),
+        ('state_name', state),
+    ]
+
+    idx = None
+    for col, value in selections:
+        if not value or value == "All":
+            continue
+        if col in index:
+            col_idx = index[col].get(value, np.array([], dtype=np.intp))
+        else:
+            # Fallback for columns without a prebuilt index
+            col_idx = np.flatnonzero((df[col] == value).to_numpy())
+        idx = col_idx if idx is None else np.intersect1d(idx, col_idx, assume_unique=True)
+
+    if idx is None:
+        return df
+    return df.take(np.sort(idx))
 
 def get_summary_stats(df):
-    """Calculate summary statistics"""
-    stats = {
+    """Calculate summary statistics
+
+    One fused .agg traversal instead of six separate reductions, so the
+    columns are read from memory once rather than per statistic.
+    """
+    agg = df.agg({
+        'deposit_amount': ['sum', 'mean'],
+        'no_of_offices': 'sum',
+        'no_of_accounts': 'sum',
+        'state_name': 'nunique',
+        'district_name': 'nunique',
+    })
+    return {
         'total_records': len(df),
-        'total_deposits': df['deposit_amount'].sum(),
-        'avg_deposits': df['deposit_amount'].mean(),
-        'total_offices': df['no_of_offices'].sum(),
-        'total_accounts': df['no_of_accounts'].sum(),
-        'unique_states': df['state_name'].nunique(),
-        'unique_districts': df['district_name'].nunique()
+        'total_deposits': agg.at['sum', 'deposit_amount'],
+        'avg_deposits': agg.at['mean', 'deposit_amount'],
+        'total_offices': agg.at['sum', 'no_of_offices'],
+        'total_accounts': agg.at['sum', 'no_of_accounts'],
+        'unique_states': int(agg.at['nunique', 'state_name']),
+        'unique_districts': int(agg.at['nunique', 'district_name']),
+    }
+
+# The reductions below are only ever fed frames from load_cleaned_data/
+# load_featured_data, which are cache_resource singletons (one object per
+# data version - see _load_processed), so hashing by object identity is
+# stable across reruns and skips Streamlit's O(rows x cols) content hash.
+# Do NOT reuse this on functions that take per-rerun filtered frames -
+# their ids change each run and the cache would never hit.
+_SINGLETON_DF_HASH = {pd.DataFrame: id}
+
+@st.cache_data(show_spinner=False, hash_funcs=_SINGLETON_DF_HASH)
+def reference_stats(df):
+    """Whole-frame reference reductions used by the prediction widgets
+
+    One .agg traversal instead of five separate mean()/max() passes.
+    """
+    agg = df[['no_of_offices', 'no_of_accounts', 'deposit_amount']].agg(['mean', 'max'])
+    return {
+        'avg_offices': agg.at['mean', 'no_of_offices'],
+        'avg_accounts': agg.at['mean', 'no_of_accounts'],
+        'avg_deposits': agg.at['mean', 'deposit_amount'],
+        'max_offices': int(agg.at['max', 'no_of_offices']),
+        'max_accounts': int(agg.at['max', 'no_of_accounts']),
+    }
+
+@st.cache_data(show_spinner=False, hash_funcs=_SINGLETON_DF_HASH)
+def regional_sums(df):
+    """Per (population_group, region) totals used by the prediction tool
+
+    Replaces repeated boolean-mask scans with a single cached lookup table.
+    """
+    grouped = df.groupby(['population_group', 'region'], observed=True)
+    sums = grouped[['deposit_amount', 'no_of_offices', 'no_of_accounts']].sum()
+    sums['record_count'] = grouped.size()
+    return sums
+
+@st.cache_data(show_spinner=False, persist="disk")
+def _regional_stats_table(mtime):
+    """Regional ranking built without materialising the full frame
+
+    Reads only the two columns the aggregation needs (column projection on
+    Parquet, usecols on CSV), so pages that show just the ranking skip the
+    full-dataset load entirely.
+    """
+    cols = ['region', 'deposit_amount']
+    parquet_path = BASE_PATH / "data" / "processed" / "cleaned_data.parquet"
+    if parquet_path.exists():
+        df = pd.read_parquet(parquet_path, engine="pyarrow", columns=cols)
+    else:
+        df = pd.read_csv(BASE_PATH / "data" / "processed" / "cleaned_data.csv", usecols=cols)
+    stats = df.groupby('region', observed=True).agg({
+        'deposit_amount': ['sum', 'mean', 'count']
+    }).round(2)
+    stats.columns = ['Total Deposits', 'Avg Deposits', 'Records']
+    return stats.sort_values('Total Deposits', ascending=False)
+
+def load_regional_stats():
+    """Regional performance ranking shown on the Insights page
+
+    Returns None when the processed data is missing or unreadable, like
+    the other loaders in this module.
+    """
+    try:
+        return _regional_stats_table(_processed_mtime("cleaned_data"))
+    except Exception as e:
+        st.error(f"Error loading regional stats: {e}")
+        return None
+
+@st.cache_data(show_spinner=False)
+def _styled_regional_html(mtime):
+    """Render the regional ranking table to HTML once per data version
+
+    Styler formatting is per-cell Python, so the rendered string is cached
+    rather than rebuilt on every rerun.
+    """
+    return _regional_stats_table(mtime).style.format({
+        'Total Deposits': '₹{:,.0f}',
+        'Avg Deposits': '₹{:,.0f}',
+        'Records': '{:,}'
+    }).to_html()
+
+def styled_regional_html():
+    """Regional ranking as HTML, or None when the data is unavailable"""
+    try:
+        return _styled_regional_html(_processed_mtime("cleaned_data"))
+    except Exception as e:
+        st.error(f"Error loading regional stats: {e}")
+        return None
+
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    """Serialise a dataframe to CSV bytes once per unique frame (download buttons)"""
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data(show_spinner=False)
+def compute_eda_aggregates(df):
+    """Precompute the summary frames shared by the EDA charts
+
+    A single pass over the filtered dataframe produces every chart's input,
+    so reruns consume tiny pre-reduced frames instead of re-scanning all rows.
+    """
+    numerical_cols = ['no_of_offices', 'no_of_accounts', 'deposit_amount']
+
+    pop_stats = df.groupby('population_group', observed=True).agg({
+        'deposit_amount': ['count', 'sum', 'mean', 'median'],
+        'no_of_offices': 'sum',
+        'no_of_accounts': 'sum'
+    }).round(2)
+    pop_stats.columns = ['Count', 'Total Deposits', 'Avg Deposits', 'Median Deposits', 'Total Offices', 'Total Accounts']
+
+    regional_stats = df.groupby('region', observed=True).agg({
+        'deposit_amount': ['sum', 'mean'],
+        'no_of_offices': 'sum',
+        'no_of_accounts': 'sum'
+    }).round(2)
+    regional_stats.columns = ['Total Deposits', 'Avg Deposits', 'Total Offices', 'Total Accounts']
+    regional_stats = regional_stats.reset_index()
+
+    if isinstance(df['state_name'].dtype, pd.CategoricalDtype):
+        # Fast path: one fused scan over the int8 codes instead of a groupby
+        cat = df['state_name'].cat
+        counts, sums, _ = groupby_sum_count_mean(
+            cat.codes.to_numpy(), df['deposit_amount'].to_numpy(), len(cat.categories))
+        top_states = pd.Series(sums, index=cat.categories)[counts > 0].nlargest(15)
+    else:
+        top_states = df.groupby('state_name', observed=True)['deposit_amount'].sum().nlargest(15)
+
+    return {
+        # Categorical value_counts emits zero rows for filtered-out groups;
+        # keep only observed ones, as the aggregations above do
+        'group_counts': df['population_group'].value_counts().loc[lambda s: s > 0],
+        'pop_stats': pop_stats,
+        'regional_stats': regional_stats,
+        'top_states': top_states,
+        'corr': df[numerical_cols].corr(),
     }
-    return stats
@@ -0,0 +1,45 @@
+"""
+Optional Numba-accelerated aggregation kernels
+
+The kernels operate on contiguous numpy arrays plus categorical codes so the
+hot EDA aggregations bypass pandas' generic dispatch. Numba is optional: when
+it is not installed the same code runs as plain (interpreted) NumPy loops via
+a no-op decorator, so the dashboard has no hard dependency on it.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is unavailable"""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+@njit(cache=True)
+def _group_reduce(codes, values, n_groups):
+    """Single linear scan computing per-group count and sum"""
+    counts = np.zeros(n_groups, dtype=np.int64)
+    sums = np.zeros(n_groups, dtype=np.float64)
+    for i in range(codes.shape[0]):
+        c = codes[i]
+        if c >= 0:  # -1 marks NaN category codes
+            counts[c] += 1
+            sums[c] += values[i]
+    return counts, sums
+
+def groupby_sum_count_mean(codes, values, n_groups):
+    """Per-group count/sum/mean over categorical codes in one pass"""
+    codes = np.ascontiguousarray(codes, dtype=np.int64)
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    counts, sums = _group_reduce(codes, values, n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    return counts, sums, means
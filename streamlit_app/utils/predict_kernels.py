@@ -0,0 +1,42 @@
+"""
+Batch prediction kernels for the what-if tooling
+
+Same optional-Numba policy as fast_aggs: the loop compiles via numba.njit
+when numba is installed and runs as plain NumPy otherwise, so batch sweeps
+(e.g. an offices x accounts what-if grid) stay fast without a hard
+dependency.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.fast_aggs import njit
+
+@njit(cache=True, fastmath=True)
+def batch_predict(offices, accounts, per_office, per_account):
+    """Weighted office/account deposit estimate over aligned float64 arrays"""
+    out = np.empty(offices.shape[0], dtype=np.float64)
+    for i in range(offices.shape[0]):
+        out[i] = 0.5 * offices[i] * per_office[i] + 0.5 * accounts[i] * per_account[i]
+    return out
+
+# Warm the JIT cache at import so the first click doesn't pay compile cost
+batch_predict(np.ones(1), np.ones(1), np.ones(1), np.ones(1))
+
+def predict_from_table(offices, accounts, groups, regions, table, default):
+    """Predict deposits for one or many scenarios from the regional sums table
+
+    Shared by the single-prediction and scenario-comparison paths so both
+    run the same weighted kernel. `table` is the cached
+    (population_group, region) sums frame; rows with no matching records
+    fall back to `default`.
+    """
+    matched = table.reindex(pd.MultiIndex.from_arrays([groups, regions]))
+    deposits = matched['deposit_amount'].to_numpy(dtype=np.float64)
+    per_office = deposits / matched['no_of_offices'].to_numpy(dtype=np.float64)
+    per_account = deposits / matched['no_of_accounts'].to_numpy(dtype=np.float64)
+    predictions = batch_predict(
+        np.asarray(offices, dtype=np.float64),
+        np.asarray(accounts, dtype=np.float64),
+        per_office, per_account)
+    return np.where(np.isnan(predictions), default, predictions)
@@ -0,0 +1,43 @@
+"""
+Shared CSS classes for the gradient/metric cards on the dashboard pages
+
+Declaring the styles once lets each card ship a tiny value-bearing div
+instead of repeating the full inline style block per card per rerun.
+"""
+
+import streamlit as st
+
+CARD_CSS = """
+<style>
+.card-violet, .card-pink, .card-blue {
+    padding: 2rem;
+    border-radius: 10px;
+    color: white;
+    text-align: center;
+}
+.card-violet { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
+.card-pink { background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); }
+.card-blue { background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); }
+.card-violet p.big, .card-pink p.big, .card-blue p.big {
+    font-size: 2.5rem;
+    font-weight: bold;
+    margin: 1rem 0;
+}
+.card-roi-green, .card-roi-blue, .card-roi-amber {
+    padding: 1.5rem;
+    border-radius: 10px;
+}
+.card-roi-green { background: #ecfdf5; border-left: 4px solid #10b981; }
+.card-roi-blue { background: #eff6ff; border-left: 4px solid #3b82f6; }
+.card-roi-amber { background: #fef3c7; border-left: 4px solid #f59e0b; }
+</style>
+"""
+
+def inject_card_css():
+    """Render the shared card styles (constant string, diffed cheaply)
+
+    Streamlit drops elements that are not re-rendered on a rerun, so the
+    style block must be emitted every run - but as a module constant it is
+    built once and the frontend diff is a no-op.
+    """
+    st.markdown(CARD_CSS, unsafe_allow_html=True)
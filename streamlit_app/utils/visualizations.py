@@ -8,6 +8,8 @@ from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 
+from utils.fast_aggs import groupby_sum_count_mean
+
 # Color schemes
 COLORS = {
     'primary': '#3b82f6',
@@ -16,103 +18,137 @@ COLORS = {
     'warning': '#f59e0b',
     'danger': '#ef4444',
     'info': '#06b6d4',
-    'population_groups': ['#3b82f6', '#10b981', '#f59e0b', '#ef4444']
+    # Tuple so plotly reuses it without a defensive copy per figure
+    'population_groups': ('#3b82f6', '#10b981', '#f59e0b', '#ef4444')
 }
 
+# Shared base layout resolved once at import instead of per-figure
+_BASE_LAYOUT = dict(template='plotly_white')
+
+# Thin separator for st.html - skips a full markdown parse per "---"
+HR = '<hr style="margin:1rem 0">'
+
 def create_distribution_plot(df, column, title=None, color=COLORS['primary']):
-    """Create histogram with distribution"""
-    fig = px.histogram(
-        df, 
-        x=column,
-        nbins=50,
-        title=title or f'Distribution of {column}',
-        color_discrete_sequence=[color]
-    )
-    
+    """Create histogram with distribution
+
+    Bins are computed server-side with np.histogram, so the figure
+    carries 50 bar heights instead of every raw value for the browser
+    to re-bin.
+    """
+    counts, edges = np.histogram(df[column].to_numpy(), bins=50)
+
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color=color
+    ))
+
     fig.update_layout(
+        title=title or f'Distribution of {column}',
         showlegend=False,
         xaxis_title=column,
         yaxis_title='Count',
-        template='plotly_white',
+        **_BASE_LAYOUT,
         height=400
     )
-    
+
     return fig
 
-def create_correlation_heatmap(df, columns):
-    """Create correlation heatmap"""
-    corr = df[columns].corr()
-    
-    fig = go.Figure(data=go.Heatmap(
+def create_correlation_heatmap(df, columns, corr=None):
+    """Create correlation heatmap (pass a precomputed corr matrix to skip the scan)"""
+    if corr is None:
+        # One BLAS pass over a contiguous float32 block instead of pandas'
+        # per-pair path; a 2-decimal heatmap needs nowhere near float64
+        arr = np.ascontiguousarray(df[columns].to_numpy(dtype=np.float32))
+        corr = pd.DataFrame(np.corrcoef(arr, rowvar=False, dtype=np.float32),
+                            index=columns, columns=columns)
+    
+    heatmap_kwargs = dict(
         z=corr.values,
         x=corr.columns,
         y=corr.columns,
         colorscale='RdBu',
-        zmid=0,
-        text=corr.values,
-        texttemplate='%{text:.2f}',
-        textfont={"size": 10}
-    ))
-    
-    fig.update_layout(
-        title='Correlation Heatmap',
-        template='plotly_white',
-        height=500,
-        width=600
+        zmid=0
     )
-    
+    if len(corr.columns) <= 12:
+        # texttemplate formats from z directly - no duplicate text array
+        heatmap_kwargs.update(texttemplate='%{z:.2f}', textfont={"size": 10})
+    else:
+        # k² in-cell text nodes dominate render on wide matrices; keep the
+        # values on hover instead
+        heatmap_kwargs['hovertemplate'] = '%{x} × %{y}: %{z:.2f}<extra></extra>'
+
+    # Layout passed at construction: one validation pass instead of two
+    fig = go.Figure(
+        data=go.Heatmap(**heatmap_kwargs),
+        layout=dict(title='Correlation Heatmap', **_BASE_LAYOUT,
+                    height=500, width=600)
+    )
+
     return fig
 
-def create_population_group_chart(df):
+def create_population_group_chart(df, group_counts=None):
     """Create population group distribution chart"""
-    group_counts = df['population_group'].value_counts()
-    
+    if group_counts is None:
+        s = df['population_group']
+        if s.dtype.name != 'category':
+            # Categorical counting is a bincount over small int codes
+            # instead of a hash-table probe per row
+            s = s.astype('category')
+        group_counts = s.value_counts()
+    
+    # Materialize labels/values once and feed both traces the same objects
+    labels = group_counts.index.astype(str).tolist()
+    values = group_counts.to_numpy()
+
     fig = make_subplots(
         rows=1, cols=2,
         specs=[[{'type': 'bar'}, {'type': 'pie'}]],
         subplot_titles=('Count by Population Group', 'Percentage Distribution')
     )
-    
+
     # Bar chart
     fig.add_trace(
         go.Bar(
-            x=group_counts.index,
-            y=group_counts.values,
+            x=labels,
+            y=values,
             marker_color=COLORS['population_groups'],
-            text=group_counts.values,
+            texttemplate='%{y}',
             textposition='outside'
         ),
         row=1, col=1
     )
-    
+
     # Pie chart
     fig.add_trace(
         go.Pie(
-            labels=group_counts.index,
-            values=group_counts.values,
+            labels=labels,
+            values=values,
             marker_colors=COLORS['population_groups']
         ),
         row=1, col=2
     )
     
     fig.update_layout(
-        template='plotly_white',
+        **_BASE_LAYOUT,
         height=400,
         showlegend=False
     )
     
     return fig
 
-def create_regional_analysis(df):
+def create_regional_analysis(df, regional_stats=None):
     """Create regional analysis charts"""
-    regional_stats = df.groupby('region').agg({
-        'deposit_amount': ['sum', 'mean'],
-        'no_of_offices': 'sum',
-        'no_of_accounts': 'sum'
-    }).round(2)
-    
-    regional_stats.columns = ['Total Deposits', 'Avg Deposits', 'Total Offices', 'Total Accounts']
-    regional_stats = regional_stats.reset_index()
+    if regional_stats is None:
+        # Named aggregation yields the flat display columns directly - no
+        # MultiIndex round trip, and only the mean actually needs rounding
+        regional_stats = df.groupby('region', observed=True).agg(**{
+            'Total Deposits': ('deposit_amount', 'sum'),
+            'Avg Deposits': ('deposit_amount', 'mean'),
+            'Total Offices': ('no_of_offices', 'sum'),
+            'Total Accounts': ('no_of_accounts', 'sum'),
+        }).reset_index()
     
     fig = make_subplots(
         rows=2, cols=2,
@@ -155,85 +191,108 @@ def create_regional_analysis(df):
     )
     
     fig.update_layout(
-        template='plotly_white',
+        **_BASE_LAYOUT,
         height=800,
         showlegend=False
     )
-    
+    # Rounding is presentation, not data: format the averages axis in the
+    # browser instead of rounding the frame
+    fig.update_yaxes(tickformat=',.2f', row=1, col=2)
+
     return fig
 
 def create_model_comparison_chart(df):
     """Create model performance comparison"""
     top_15 = df.head(15)
     
-    fig = go.Figure()
-    
+    fig = go.Figure(layout=dict(
+        title='Top 15 Models by R² Score',
+        xaxis_title='R² Score',
+        yaxis=dict(title='Model', categoryorder='total ascending'),
+        **_BASE_LAYOUT,
+        height=600
+    ))
+
     fig.add_trace(go.Bar(
         y=top_15['model_name'],
         x=top_15['test_r2'],
         orientation='h',
         marker_color=COLORS['primary'],
-        text=top_15['test_r2'].round(4),
+        texttemplate='%{x:.4f}',
         textposition='outside'
     ))
-    
-    fig.update_layout(
-        title='Top 15 Models by R² Score',
-        xaxis_title='R² Score',
-        yaxis_title='Model',
-        template='plotly_white',
-        height=600,
-        yaxis={'categoryorder': 'total ascending'}
-    )
-    
+
     return fig
 
 def create_scatter_r2_vs_time(df):
     """Create scatter plot of R² vs Training Time"""
-    # Create a safe size column (ensure positive values for marker size)
-    df_plot = df.copy()
-    df_plot['marker_size'] = df_plot['test_r2'].clip(lower=0) * 100 + 5  # Scale and add minimum size
-    
+    # Safe marker sizes (positive values) as a plain array - px.scatter
+    # accepts array-likes for size, so no copy-and-insert on the frame
+    marker_size = np.clip(df['test_r2'].to_numpy(), 0, None) * 100 + 5
+
     fig = px.scatter(
-        df_plot,
+        df,
         x='training_time',
         y='test_r2',
         color='test_r2',
-        size='marker_size',
+        size=marker_size,
         hover_data=['model_name', 'test_rmse', 'test_mae'],
         title='R² Score vs Training Time Trade-off',
-        color_continuous_scale='Viridis'
+        color_continuous_scale='Viridis',
+        render_mode='webgl'
     )
     
     fig.update_layout(
         xaxis_title='Training Time (seconds)',
         yaxis_title='R² Score',
-        template='plotly_white',
+        **_BASE_LAYOUT,
         height=500
     )
     
     return fig
 
-def create_actual_vs_predicted(y_true, y_pred):
-    """Create actual vs predicted scatter plot"""
-    fig = go.Figure()
-    
-    # Scatter plot
-    fig.add_trace(go.Scatter(
+def create_actual_vs_predicted(y_true, y_pred, max_points=20000):
+    """Create actual vs predicted scatter plot
+
+    Inputs longer than max_points are uniformly subsampled before
+    plotting - the cloud is visually saturated well below that - while
+    the reference diagonal still spans the full data range.
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+
+    # Range of the perfect-prediction line, from the full arrays
+    min_val = min(y_true.min(), y_pred.min())
+    max_val = max(y_true.max(), y_pred.max())
+
+    if len(y_true) > max_points:
+        keep = np.random.default_rng(0).choice(len(y_true), max_points, replace=False)
+        y_true = y_true[keep]
+        y_pred = y_pred[keep]
+
+    fig = go.Figure(layout=dict(
+        title='Actual vs Predicted Deposits',
+        xaxis_title='Actual Deposit Amount',
+        yaxis_title='Predicted Deposit Amount',
+        **_BASE_LAYOUT,
+        height=500
+    ))
+
+    # Scatter plot - WebGL trace so large prediction sets render on the GPU
+    fig.add_trace(go.Scattergl(
         x=y_true,
         y=y_pred,
         mode='markers',
         marker=dict(
             color=COLORS['primary'],
             size=5,
-            opacity=0.6
+            opacity=0.6,
+            line=dict(width=0)  # per-point strokes dominate GL render cost
         ),
         name='Predictions'
     ))
     
     # Perfect prediction line
-    min_val = min(y_true.min(), y_pred.min())
-    max_val = max(y_true.max(), y_pred.max())
     fig.add_trace(go.Scatter(
         x=[min_val, max_val],
         y=[min_val, max_val],
@@ -241,15 +300,7 @@ def create_actual_vs_predicted(y_true, y_pred):
         line=dict(color='red', dash='dash'),
         name='Perfect Prediction'
     ))
-    
-    fig.update_layout(
-        title='Actual vs Predicted Deposits',
-        xaxis_title='Actual Deposit Amount',
-        yaxis_title='Predicted Deposit Amount',
-        template='plotly_white',
-        height=500
-    )
-    
+
     return fig
 
 def create_feature_importance_chart(features, importance):
@@ -257,25 +308,23 @@ def create_feature_importance_chart(features, importance):
     df = pd.DataFrame({
         'feature': features,
         'importance': importance
-    }).sort_values('importance', ascending=True).tail(15)
-    
-    fig = go.Figure()
+    }).nlargest(15, 'importance').iloc[::-1]  # reversed for ascending display
     
+    fig = go.Figure(layout=dict(
+        title='Top 15 Most Important Features',
+        xaxis_title='Importance Score',
+        yaxis_title='Feature',
+        **_BASE_LAYOUT,
+        height=600
+    ))
+
     fig.add_trace(go.Bar(
         y=df['feature'],
         x=df['importance'],
         orientation='h',
         marker_color=COLORS['success']
     ))
-    
-    fig.update_layout(
-        title='Top 15 Most Important Features',
-        xaxis_title='Importance Score',
-        yaxis_title='Feature',
-        template='plotly_white',
-        height=600
-    )
-    
+
     return fig
 
 def create_box_plot_by_category(df, numerical_col, categorical_col):
@@ -289,35 +338,52 @@ def create_box_plot_by_category(df, numerical_col, categorical_col):
     )
     
     fig.update_layout(
-        template='plotly_white',
+        **_BASE_LAYOUT,
         height=500,
         showlegend=False
     )
     
     return fig
 
-def create_top_states_chart(df, top_n=10):
-    """Create top states by deposits chart"""
-    top_states = df.groupby('state_name')['deposit_amount'].sum().sort_values(ascending=False).head(top_n)
-    
-    fig = go.Figure()
-    
+def create_top_states_chart(df, top_n=10, top_states=None, show_text=None):
+    """Create top states by deposits chart
+
+    Bar labels default to on for readable bar counts and off past 12
+    bars, where the per-bar SVG text nodes start to dominate render
+    time without being legible anyway.
+    """
+    if top_states is None:
+        s = df['state_name']
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # Fused scan over the category codes (JIT-compiled in fast_aggs
+            # when numba is installed) instead of the hash-based grouper
+            counts, sums, _ = groupby_sum_count_mean(
+                s.cat.codes.to_numpy(), df['deposit_amount'].to_numpy(),
+                len(s.cat.categories))
+            top_states = pd.Series(sums, index=s.cat.categories)[counts > 0].nlargest(top_n)
+        else:
+            # nlargest: heap selection of the top N, no full sort of the tail
+            top_states = df.groupby('state_name', observed=True)['deposit_amount'].sum().nlargest(top_n)
+    
+    if show_text is None:
+        show_text = len(top_states) <= 12
+    # Labels formatted by plotly.js - no per-bar Python f-strings
+    text_kwargs = dict(texttemplate='₹%{x:,.0f}', textposition='outside') if show_text else {}
+
+    fig = go.Figure(layout=dict(
+        title=f'Top {top_n} States by Total Deposits',
+        xaxis_title='Total Deposit Amount (₹)',
+        yaxis=dict(title='State', categoryorder='total ascending'),
+        **_BASE_LAYOUT,
+        height=500
+    ))
+
     fig.add_trace(go.Bar(
         x=top_states.values,
         y=top_states.index,
         orientation='h',
         marker_color=COLORS['secondary'],
-        text=[f'₹{val:,.0f}' for val in top_states.values],
-        textposition='outside'
+        **text_kwargs
     ))
-    
-    fig.update_layout(
-        title=f'Top {top_n} States by Total Deposits',
-        xaxis_title='Total Deposit Amount (₹)',
-        yaxis_title='State',
-        template='plotly_white',
-        height=500,
-        yaxis={'categoryorder': 'total ascending'}
-    )
-    
+
     return fig